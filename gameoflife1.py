@@ -32,16 +32,30 @@ class GameOfLife:
         self.update()
 
     def draw_grid(self):
-        self.canvas.delete("all")
+        # Create the rectangles once, afterwards only recolor cells that changed
+        if not self.cells:
+            for i in range(self.rows):
+                for j in range(self.cols):
+                    x1 = j * self.cell_size
+                    y1 = i * self.cell_size
+                    x2 = x1 + self.cell_size
+                    y2 = y1 + self.cell_size
+                    rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="gray")
+                    self.cells[(i, j)] = rect
+            self.drawn = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+
+        # Collect the changed cells first, then update the canvas in one batch
+        changed = []
         for i in range(self.rows):
-            for j in range(self.cols):
-                x1 = j * self.cell_size
-                y1 = i * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                color = "black" if self.grid[i][j] == 1 else "white"
-                rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
-                self.cells[(i, j)] = rect
+            row = list(self.grid[i])
+            if row == self.drawn[i]:
+                continue
+            for j, (state, old_state) in enumerate(zip(row, self.drawn[i])):
+                if state != old_state:
+                    changed.append((self.cells[(i, j)], "black" if state == 1 else "white"))
+            self.drawn[i] = row
+        for rect, color in changed:
+            self.canvas.itemconfig(rect, fill=color)
 
     def set_initial_glider(self):
         # Place a glider at the top-left (rows 0-2, cols 0-2)
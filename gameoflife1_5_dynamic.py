@@ -2,14 +2,36 @@ import tkinter as tk
 import random
 import time
 from tkinter import messagebox
-import copy
+from gameoflife_history import GridHistory
+from gameoflife_hashlife import HashlifeEngine
+from gameoflife_sparse import ActiveFrontierEngine
+from gameoflife_worker import SimulationWorker, copy_grid
+
+# Stepping engines selectable from the rules panel (None = pure Python loops)
+ENGINES = {"Python": None, "Active frontier": ActiveFrontierEngine, "Hashlife": HashlifeEngine}
+try:
+    from gameoflife_numpy import NumpyEngine
+    from gameoflife_bitpacked import BitPackedEngine
+    from gameoflife_blocklut import BlockLookupEngine
+    from gameoflife_tiled import TiledUniverse
+    from gameoflife_multiprocess import MultiprocessEngine
+    from gameoflife_threaded import ThreadedEngine
+    ENGINES["NumPy"] = NumpyEngine
+    ENGINES["Bit-packed"] = BitPackedEngine
+    ENGINES["Block lookup"] = BlockLookupEngine
+    ENGINES["Tiled (unbounded)"] = TiledUniverse
+    ENGINES["Threaded"] = ThreadedEngine
+    ENGINES["Multiprocess"] = MultiprocessEngine
+except ImportError:  # NumPy not installed, only the pure Python engine is available
+    pass
 
 class GameOfLife:
     # Game rules as configurable variables
     SURVIVAL_RULE = [2, 3]  # Cells with this many neighbors survive
     BIRTH_RULE = [3]        # Dead cells with this many neighbors become alive
     UPDATE_INTERVAL = 1     # Milliseconds between updates
-    MAX_HISTORY = 1000      # Maximum number of grid states to store
+    FRAME_INTERVAL = 16     # Milliseconds between frames when simulating in the background
+    MAX_HISTORY_BYTES = 64 * 1024 * 1024  # Memory budget for stored grid states
 
     def __init__(self, root, rows=100, cols=100):
         self.root = root
@@ -19,13 +41,15 @@ class GameOfLife:
         self.running = False
         self.last_update_time = time.time()
         self.fps = 0
-        self.grid_history = []  # Store grid states for back navigation
-        self.history_index = 0  # Current position in history
+        self.grid_history = GridHistory(rows, cols, self.MAX_HISTORY_BYTES)  # Grid states for back navigation
+        self.engine = None  # Optional vectorized engine, see select_engine
+        self.worker = None  # Background simulation thread, see start_worker
+        self.worker_running = False
 
         # Initialize grid (0 = white/dead, 1 = black/alive)
         self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
         self.set_initial_glider()  # Place glider at start
-        self.grid_history.append(copy.deepcopy(self.grid))  # Save initial state
+        self.grid_history.reset(self.grid)  # Save initial state
 
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
@@ -58,6 +82,10 @@ class GameOfLife:
         self.back_button.pack(side=tk.LEFT, padx=5)
         self.next_button = tk.Button(self.control_frame, text="Next", command=self.next, state="normal")
         self.next_button.pack(side=tk.LEFT, padx=5)
+        # Simulate on a background thread and only sample frames for display
+        self.background_var = tk.BooleanVar(value=False)
+        self.background_check = tk.Checkbutton(self.control_frame, text="Background", variable=self.background_var, command=self.toggle_background)
+        self.background_check.pack(side=tk.LEFT, padx=5)
 
         # Rules panel
         self.rules_frame = tk.Frame(root)
@@ -85,6 +113,12 @@ class GameOfLife:
         self.apply_button = tk.Button(self.rules_frame, text="Apply Rules", command=self.apply_rules)
         self.apply_button.pack(side=tk.LEFT, padx=5)
 
+        # Engine selection
+        tk.Label(self.rules_frame, text="Engine:").pack(side=tk.LEFT)
+        self.engine_var = tk.StringVar(value="Python")
+        self.engine_menu = tk.OptionMenu(self.rules_frame, self.engine_var, *ENGINES, command=self.select_engine)
+        self.engine_menu.pack(side=tk.LEFT, padx=5)
+
         # Draw initial grid
         self.cells = {}
         self.draw_grid()
@@ -92,30 +126,43 @@ class GameOfLife:
         # Start the update loop
         self.update()
 
-    def draw_grid(self):
-        self.canvas.delete("all")
+    def draw_grid(self, grid=None):
+        grid = self.grid if grid is None else grid
+        # Create the rectangles once, afterwards only recolor cells that changed
+        if not self.cells:
+            for i in range(self.rows):
+                for j in range(self.cols):
+                    x1 = j * self.cell_size
+                    y1 = i * self.cell_size
+                    x2 = x1 + self.cell_size
+                    y2 = y1 + self.cell_size
+                    rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="gray")
+                    self.cells[(i, j)] = rect
+            self.drawn = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+
+        # Collect the changed cells first, then update the canvas in one batch
+        changed = []
         for i in range(self.rows):
-            for j in range(self.cols):
-                x1 = j * self.cell_size
-                y1 = i * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                color = "black" if self.grid[i][j] == 1 else "white"
-                rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
-                self.cells[(i, j)] = rect
+            row = list(grid[i])
+            if row == self.drawn[i]:
+                continue
+            for j, (state, old_state) in enumerate(zip(row, self.drawn[i])):
+                if state != old_state:
+                    changed.append((self.cells[(i, j)], "black" if state == 1 else "white"))
+            self.drawn[i] = row
+        for rect, color in changed:
+            self.canvas.itemconfig(rect, fill=color)
 
     def on_canvas_click(self, event):
         col = event.x // self.cell_size
         row = event.y // self.cell_size
         if 0 <= row < self.rows and 0 <= col < self.cols:
+            was_running = self.pause_worker()
             self.grid[row][col] = 1
-            self.grid_history = self.grid_history[:self.history_index + 1]  # Truncate history
-            self.grid_history.append(copy.deepcopy(self.grid))  # Save new state
-            self.history_index += 1
-            if len(self.grid_history) > self.MAX_HISTORY:  # Limit history to 1000
-                self.grid_history.pop(0)
-                self.history_index -= 1
+            self.grid_history.append(self.grid)  # Save new state, dropping any states ahead
             self.draw_grid()
+            if was_running:
+                self.start_worker()
 
     def set_initial_glider(self):
         glider_positions = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
@@ -129,6 +176,7 @@ class GameOfLife:
             num_gliders = 10  # Default to 10 if invalid input
 
         num_gliders = max(1, min(num_gliders, 1000))
+        was_running = self.pause_worker()
         
         for _ in range(num_gliders):
             x, y = random.randint(0, self.cols - 3), random.randint(0, self.rows - 3)
@@ -136,13 +184,10 @@ class GameOfLife:
             for gy, gx in glider_positions:
                 self.grid[gy][gx] = 1
         
-        self.grid_history = self.grid_history[:self.history_index + 1]  # Truncate history
-        self.grid_history.append(copy.deepcopy(self.grid))  # Save new state
-        self.history_index += 1
-        if len(self.grid_history) > self.MAX_HISTORY:  # Limit history to 1000
-            self.grid_history.pop(0)
-            self.history_index -= 1
+        self.grid_history.append(self.grid)  # Save new state, dropping any states ahead
         self.draw_grid()
+        if was_running:
+            self.start_worker()
         print(f"Generated {num_gliders} random gliders")
 
     def start(self):
@@ -151,22 +196,28 @@ class GameOfLife:
         self.stop_button.config(state="normal")
         self.back_button.config(state="disabled")
         self.next_button.config(state="disabled")
+        if self.background_var.get():
+            self.start_worker()
         print("Start pressed: Game of Life running")
 
     def stop(self):
         self.running = False
+        if self.pause_worker():
+            self.draw_grid()  # Show the generation the worker stopped at
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         self.back_button.config(state="normal")
         self.next_button.config(state="normal")
         print("Stop pressed")
+        if self.engine is not None and hasattr(self.engine, "report"):
+            print(self.engine.report())
 
     def clear(self):
         self.running = False
+        self.pause_worker()
         self.grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
         self.set_initial_glider()
-        self.grid_history = [copy.deepcopy(self.grid)]  # Reset history
-        self.history_index = 0
+        self.grid_history.reset(self.grid)  # Reset history
         self.draw_grid()
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
@@ -174,25 +225,44 @@ class GameOfLife:
         self.next_button.config(state="normal")
         print("Clear pressed: Grid reset with glider")
 
+    def start_worker(self):
+        if self.worker is None:
+            self.worker = SimulationWorker(self.advance, lambda: copy_grid(self.grid))
+        self.last_worker_generation = self.worker.generation
+        self.last_stats_time = time.time()
+        self.frames_drawn = 0
+        self.worker.resume()
+        self.worker_running = True
+
+    def pause_worker(self):
+        # Returns True if the worker was running, so callers can restart it afterwards
+        if not self.worker_running:
+            return False
+        self.worker.pause()
+        self.worker_running = False
+        return True
+
+    def toggle_background(self):
+        if not self.running:
+            return
+        if self.background_var.get():
+            self.start_worker()
+        elif self.pause_worker():
+            self.draw_grid()
+
     def back(self):
-        if self.history_index > 0:
-            self.history_index -= 1
-            self.grid = copy.deepcopy(self.grid_history[self.history_index])
+        grid = self.grid_history.back()
+        if grid is not None:
+            self.grid = grid
             self.draw_grid()
             print("Back pressed: Reverted to previous generation")
 
     def next(self):
-        if self.history_index < len(self.grid_history) - 1:
-            self.history_index += 1
-            self.grid = copy.deepcopy(self.grid_history[self.history_index])
+        if self.grid_history.index < len(self.grid_history) - 1:
+            self.grid = self.grid_history.forward()
         else:
             self.next_generation()
-            self.grid_history = self.grid_history[:self.history_index + 1]  # Truncate history
-            self.grid_history.append(copy.deepcopy(self.grid))  # Save new state
-            self.history_index += 1
-            if len(self.grid_history) > self.MAX_HISTORY:  # Limit history to 1000
-                self.grid_history.pop(0)
-                self.history_index -= 1
+            self.grid_history.append(self.grid)  # Save new state, dropping any states ahead
         self.draw_grid()
         print("Next pressed: Advanced to next generation")
 
@@ -208,32 +278,33 @@ class GameOfLife:
         return total
 
     def apply_rules(self):
+        was_running = self.pause_worker()
         try:
-            # Parse survival rule
+            # Parse into locals first, the app keeps its rules until the engine accepts the new ones
             survival_str = self.survival_input.get().strip()
             if survival_str in ["", "[]"]:
-                self.SURVIVAL_RULE = []
+                survival_rule = []
             else:
-                self.SURVIVAL_RULE = [int(x) for x in survival_str.split(",") if x.strip().isdigit()]
-                if not self.SURVIVAL_RULE:
+                survival_rule = [int(x) for x in survival_str.split(",") if x.strip().isdigit()]
+                if not survival_rule:
                     raise ValueError("Survival rule must contain valid numbers or be empty ([])")
 
                 # Validate survival rule values
-                for num in self.SURVIVAL_RULE:
+                for num in survival_rule:
                     if num < 0 or num > 8:
                         raise ValueError("Survival rule numbers must be between 0 and 8")
 
             # Parse birth rule
             birth_str = self.birth_input.get().strip()
             if birth_str in ["", "[]"]:
-                self.BIRTH_RULE = []
+                birth_rule = []
             else:
-                self.BIRTH_RULE = [int(x) for x in birth_str.split(",") if x.strip().isdigit()]
-                if not self.BIRTH_RULE:
+                birth_rule = [int(x) for x in birth_str.split(",") if x.strip().isdigit()]
+                if not birth_rule:
                     raise ValueError("Birth rule must contain valid numbers or be empty ([])")
 
                 # Validate birth rule values
-                for num in self.BIRTH_RULE:
+                for num in birth_rule:
                     if num < 0 or num > 8:
                         raise ValueError("Birth rule numbers must be between 0 and 8")
 
@@ -241,16 +312,69 @@ class GameOfLife:
             interval = self.update_interval_input.get().strip()
             if not interval.isdigit():
                 raise ValueError("Update interval must be a positive integer")
-            self.UPDATE_INTERVAL = int(interval)
-            if self.UPDATE_INTERVAL < 1:
+            update_interval = int(interval)
+            if update_interval < 1:
                 raise ValueError("Update interval must be at least 1 ms")
 
+            # Any engine may reject a rule, e.g. Hashlife and the tiled universe refuse B0
+            if self.engine is not None:
+                try:
+                    self.engine.set_rules(survival_rule, birth_rule)
+                except ValueError as e:
+                    self.show_rules()
+                    raise ValueError(f"{self.engine_var.get()} engine: {e}. Keeping the previous rules.")
+            self.SURVIVAL_RULE = survival_rule
+            self.BIRTH_RULE = birth_rule
+            self.UPDATE_INTERVAL = update_interval
             print(f"Applied rules: Survival={self.SURVIVAL_RULE}, Birth={self.BIRTH_RULE}, Interval={self.UPDATE_INTERVAL}ms")
         except ValueError as e:
             messagebox.showerror("Invalid Input", str(e))
             print(f"Error applying rules: {e}")
+        if was_running:
+            self.start_worker()
+
+    def show_rules(self):
+        """Put the rules in effect back into the input fields."""
+        for entry, rule in ((self.survival_input, self.SURVIVAL_RULE), (self.birth_input, self.BIRTH_RULE)):
+            entry.delete(0, tk.END)
+            entry.insert(0, ",".join(map(str, rule)) if rule else "[]")
+
+    def close_engine(self, engine):
+        # Engines backed by worker processes or shared memory need an explicit shutdown
+        if engine is not None and hasattr(engine, "close"):
+            engine.close()
+
+    def select_engine(self, name):
+        was_running = self.pause_worker()
+        old_engine = self.engine
+        engine_class = ENGINES[name]
+        if engine_class is None:
+            self.engine = None
+            self.grid = [list(map(int, row)) for row in self.grid]
+        else:
+            try:
+                self.engine = engine_class(self.rows, self.cols, self.SURVIVAL_RULE, self.BIRTH_RULE)
+            except ValueError as e:
+                messagebox.showerror("Invalid Engine", str(e))
+                self.engine_var.set("Python")
+                self.select_engine("Python")
+                if was_running:
+                    self.start_worker()
+                return
+            self.engine.load(self.grid)
+            # Snapshots support grid[i][j], so the rest of the app works unchanged
+            self.grid = self.engine.snapshot()
+        self.close_engine(old_engine)
+        if was_running:
+            self.start_worker()
+        print(f"Selected engine: {name}")
 
     def next_generation(self):
+        if self.engine is not None:
+            self.engine.load(self.grid)
+            self.engine.step()
+            self.grid = self.engine.snapshot()
+            return
         new_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
         for i in range(self.rows):
             for j in range(self.cols):
@@ -263,15 +387,17 @@ class GameOfLife:
                     new_grid[i][j] = 1 if self.BIRTH_RULE and neighbors in self.BIRTH_RULE else 0
         self.grid = new_grid
 
+    def advance(self):
+        self.next_generation()
+        self.grid_history.append(self.grid)  # Save new state, dropping any states ahead
+
     def update(self):
+        if self.worker_running:
+            self.update_background()
+            return
+
         if self.running:
-            self.next_generation()
-            self.grid_history = self.grid_history[:self.history_index + 1]  # Truncate history
-            self.grid_history.append(copy.deepcopy(self.grid))  # Save new state
-            self.history_index += 1
-            if len(self.grid_history) > self.MAX_HISTORY:  # Limit history to 1000
-                self.grid_history.pop(0)
-                self.history_index -= 1
+            self.advance()
             self.draw_grid()
         
         # Calculate FPS
@@ -282,11 +408,34 @@ class GameOfLife:
         
         self.root.after(self.UPDATE_INTERVAL, self.update)
 
+    def update_background(self):
+        # Sample the newest generation the worker finished, skipping the ones in between
+        frame, generation = self.worker.latest()
+        if frame is not None:
+            self.draw_grid(frame)
+            self.frames_drawn += 1
+
+        # Report frames/sec and generations/sec every 0.5 seconds
+        current_time = time.time()
+        elapsed = current_time - self.last_stats_time
+        if elapsed >= 0.5:
+            fps = self.frames_drawn / elapsed
+            gps = (self.worker.generation - self.last_worker_generation) / elapsed
+            self.fps_label.config(text=f"FPS: {fps:.1f}  Generations/s: {gps:.1f}")
+            self.frames_drawn = 0
+            self.last_worker_generation = self.worker.generation
+            self.last_stats_time = current_time
+        self.last_update_time = current_time
+
+        self.root.after(self.FRAME_INTERVAL, self.update)
+
 def main():
     root = tk.Tk()
     root.title("Game of Life - Dynamic Rules")
     app = GameOfLife(root)
     root.mainloop()
+    app.pause_worker()
+    app.close_engine(app.engine)
 
 if __name__ == "__main__":
     main()
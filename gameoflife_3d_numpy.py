@@ -0,0 +1,77 @@
+import numpy as np
+
+class Numpy3DEngine:
+    """3D Life with a bounded (non-wrapping) cube and min/max neighbor rules.
+
+    The 26-neighborhood is three separable 1D box sums over a zero padded
+    copy of the grid. The result feeds a state * 27 + neighbors lookup table
+    built from the SURVIVAL_MIN/MAX and BIRTH_MIN/MAX ranges of the OpenGL
+    apps. All buffers are allocated once.
+    """
+
+    def __init__(self, size, survival_min=4, survival_max=5, birth_min=4, birth_max=4):
+        shape = (size,) * 3 if isinstance(size, int) else tuple(size)
+        self.size = size
+        self.shape = shape
+        x, y, z = shape
+        self.grid = np.zeros(shape, dtype=np.uint8)
+        self.padded = np.zeros((x + 2, y + 2, z + 2), dtype=np.uint8)  # Border stays 0: no wrapping
+        self.sum_x = np.zeros((x, y + 2, z + 2), dtype=np.uint8)
+        self.sum_xy = np.zeros((x, y, z + 2), dtype=np.uint8)
+        self.index = np.zeros(shape, dtype=np.uint8)
+        self.scaled = np.zeros(shape, dtype=np.uint8)
+        self.rules = None
+        self.set_rules(survival_min, survival_max, birth_min, birth_max)
+
+    def set_rules(self, survival_min, survival_max, birth_min, birth_max):
+        rules = (survival_min, survival_max, birth_min, birth_max)
+        if rules == self.rules:
+            return
+        self.rules = rules
+        neighbors = np.arange(27)
+        self.table = np.concatenate([(birth_min <= neighbors) & (neighbors <= birth_max),
+                                     (survival_min <= neighbors) & (neighbors <= survival_max)]).astype(np.uint8)
+
+    def load(self, grid):
+        if grid is not self.grid:
+            np.copyto(self.grid, np.asarray(grid), casting="unsafe")
+
+    def count_neighbors(self):
+        """Fill self.index with the 3x3x3 box sum of every cell, the cell itself included."""
+        p, sx, sxy, total = self.padded, self.sum_x, self.sum_xy, self.index
+        p[1:-1, 1:-1, 1:-1] = self.grid
+        np.add(p[:-2], p[1:-1], out=sx)
+        sx += p[2:]
+        np.add(sx[:, :-2], sx[:, 1:-1], out=sxy)
+        sxy += sx[:, 2:]
+        np.add(sxy[:, :, :-2], sxy[:, :, 1:-1], out=total)
+        total += sxy[:, :, 2:]
+        return total
+
+    def step(self, generations=1):
+        for _ in range(generations):
+            index = self.count_neighbors()
+            # Box sum + 26 * state == state * 27 + neighbors
+            np.multiply(self.grid, 26, out=self.scaled)
+            index += self.scaled
+            np.take(self.table, index, out=self.grid)
+
+    def snapshot(self):
+        return self.grid
+
+    def population(self):
+        return int(np.count_nonzero(self.grid))
+
+# One engine per grid shape and rule, reused by step_grid
+ENGINES = {}
+
+def step_grid(grid, survival_min, survival_max, birth_min, birth_max):
+    """Drop-in for the update_grid loops of the 3D apps: returns the next generation as a new array."""
+    grid = np.asarray(grid)
+    key = (grid.shape, survival_min, survival_max, birth_min, birth_max)
+    engine = ENGINES.get(key)
+    if engine is None:
+        engine = ENGINES[key] = Numpy3DEngine(grid.shape, survival_min, survival_max, birth_min, birth_max)
+    engine.load(grid)
+    engine.step()
+    return engine.grid.copy()
@@ -4,6 +4,8 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 import numpy as np
+from gameoflife_3d_numpy import step_grid
+from gameoflife_glcells import DisplayListCache
 from copy import deepcopy
 import random
 
@@ -43,33 +45,10 @@ def add_random_gliders(grid):
                     grid[x+dz, y+dx, z+dy] = 1
     return grid
 
-def count_neighbors(grid, x, y, z):
-    count = 0
-    for i in range(-1, 2):
-        for j in range(-1, 2):
-            for k in range(-1, 2):
-                if i == 0 and j == 0 and k == 0:
-                    continue
-                nx, ny, nz = x + i, y + j, z + k
-                if 0 <= nx < 20 and 0 <= ny < 20 and 0 <= nz < 20:
-                    count += grid[nx, ny, nz]
-    return count
-
 def update_grid(grid):
-    new_grid = np.zeros((20, 20, 20), dtype=int)
-    for x in range(20):
-        for y in range(20):
-            for z in range(20):
-                neighbors = count_neighbors(grid, x, y, z)
-                if grid[x, y, z] == 1:
-                    if 3 <= neighbors <= 5:  # Survives
-                        new_grid[x, y, z] = 1
-                else:
-                    if 4 <= neighbors <= 6:  # Born
-                        new_grid[x, y, z] = 1
-    return new_grid
+    return step_grid(grid, 4, 6, 5, 7)
 
-def draw_cube():
+def build_cube():
     # Define vertices for the main cube (20x20x20)
     vertices = [
         (10, -10, -10), (10, 10, -10), (-10, 10, -10), (-10, -10, -10),  # Back face
@@ -185,7 +164,7 @@ def draw_text(x, y, text, font=GLUT_BITMAP_HELVETICA_12):
     for char in text:
         glutBitmapCharacter(font, ord(char))
 
-def draw_ui(zoom_in_rect, zoom_out_rect, start_rect, stop_rect, next_rect, back_rect, clear_rect, generate_rect, running, screen_width, screen_height):
+def build_ui(zoom_in_rect, zoom_out_rect, start_rect, stop_rect, next_rect, back_rect, clear_rect, generate_rect, running, screen_width, screen_height):
     # Switch to 2D orthographic projection for UI
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
@@ -253,6 +232,15 @@ def draw_ui(zoom_in_rect, zoom_out_rect, start_rect, stop_rect, next_rect, back_
     glMatrixMode(GL_MODELVIEW)
     glPopMatrix()
 
+# The lattice never changes and the UI panel only with the window size or the running state
+geometry = DisplayListCache()
+
+def draw_cube():
+    geometry.call("cube", None, build_cube)
+
+def draw_ui(*args):
+    geometry.call("ui", args, build_ui, *args)
+
 def update_projection(screen_width, screen_height, zoom):
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
@@ -4,6 +4,8 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 import numpy as np
+from gameoflife_3d_numpy import step_grid
+from gameoflife_glcells import DisplayListCache
 from copy import deepcopy
 import random
 
@@ -47,33 +49,10 @@ def add_random_gliders(grid):
                     grid[x+dz, y+dx, z+dy] = 1
     return grid
 
-def count_neighbors(grid, x, y, z):
-    count = 0
-    for i in range(-1, 2):
-        for j in range(-1, 2):
-            for k in range(-1, 2):
-                if i == 0 and j == 0 and k == 0:
-                    continue
-                nx, ny, nz = x + i, y + j, z + k
-                if 0 <= nx < GRID_SIZE and 0 <= ny < GRID_SIZE and 0 <= nz < GRID_SIZE:
-                    count += grid[nx, ny, nz]
-    return count
-
 def update_grid(grid):
-    new_grid = np.zeros((GRID_SIZE, GRID_SIZE, GRID_SIZE), dtype=int)
-    for x in range(GRID_SIZE):
-        for y in range(GRID_SIZE):
-            for z in range(GRID_SIZE):
-                neighbors = count_neighbors(grid, x, y, z)
-                if grid[x, y, z] == 1:
-                    if SURVIVAL_MIN <= neighbors <= SURVIVAL_MAX:
-                        new_grid[x, y, z] = 1
-                else:
-                    if BIRTH_MIN <= neighbors <= BIRTH_MAX:
-                        new_grid[x, y, z] = 1
-    return new_grid
+    return step_grid(grid, SURVIVAL_MIN, SURVIVAL_MAX, BIRTH_MIN, BIRTH_MAX)
 
-def draw_cube():
+def build_cube():
     vertices = [
         (GRID_SIZE/2, -GRID_SIZE/2, -GRID_SIZE/2), (GRID_SIZE/2, GRID_SIZE/2, -GRID_SIZE/2),
         (-GRID_SIZE/2, GRID_SIZE/2, -GRID_SIZE/2), (-GRID_SIZE/2, -GRID_SIZE/2, -GRID_SIZE/2),
@@ -173,7 +152,7 @@ def draw_text(x, y, text, font=GLUT_BITMAP_HELVETICA_12):
     for char in text:
         glutBitmapCharacter(font, ord(char))
 
-def draw_ui(zoom_in_rect, zoom_out_rect, start_rect, stop_rect, next_rect, back_rect, clear_rect, generate_rect, running, screen_width, screen_height):
+def build_ui(zoom_in_rect, zoom_out_rect, start_rect, stop_rect, next_rect, back_rect, clear_rect, generate_rect, running, screen_width, screen_height):
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
     glLoadIdentity()
@@ -218,6 +197,15 @@ def draw_ui(zoom_in_rect, zoom_out_rect, start_rect, stop_rect, next_rect, back_
     glMatrixMode(GL_MODELVIEW)
     glPopMatrix()
 
+# The lattice and the UI panel only change with GRID_SIZE, the window size or the running state
+geometry = DisplayListCache()
+
+def draw_cube():
+    geometry.call("cube", GRID_SIZE, build_cube)
+
+def draw_ui(*args):
+    geometry.call("ui", args, build_ui, *args)
+
 def update_projection(screen_width, screen_height, zoom):
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
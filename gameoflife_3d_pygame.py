@@ -1,5 +1,6 @@
 import pygame
 import numpy as np
+from gameoflife_3d_numpy import step_grid
 import platform
 import asyncio
 import random
@@ -68,33 +69,9 @@ button_right = pygame.Rect(380, WINDOW_SIZE + 45, 80, 25)
 button_up = pygame.Rect(200, WINDOW_SIZE + 45, 80, 25)
 button_down = pygame.Rect(110, WINDOW_SIZE + 45, 80, 25)
 
-def count_neighbors(grid, x, y, z):
-    """Count live neighbors in 3x3x3 grid around (x, y, z)."""
-    count = 0
-    for i in range(-1, 2):
-        for j in range(-1, 2):
-            for k in range(-1, 2):
-                if i == 0 and j == 0 and k == 0:
-                    continue
-                nx, ny, nz = x + i, y + j, z + k
-                if 0 <= nx < GRID_SIZE and 0 <= ny < GRID_SIZE and 0 <= nz < GRID_SIZE:
-                    count += grid[nx, ny, nz]
-    return count
-
 def update_grid(grid):
     """Apply 3D Game of Life rules."""
-    new_grid = np.copy(grid)
-    for x in range(GRID_SIZE):
-        for y in range(GRID_SIZE):
-            for z in range(GRID_SIZE):
-                neighbors = count_neighbors(grid, x, y, z)
-                if grid[x, y, z] == 1:
-                    if neighbors < 4 or neighbors > 6:
-                        new_grid[x, y, z] = 0
-                else:
-                    if neighbors == 5:
-                        new_grid[x, y, z] = 1
-    return new_grid
+    return step_grid(grid, 4, 6, 5, 5)
 
 def place_glider(grid, x, y, z):
     """Place a 3D glider at position (x, y, z)."""
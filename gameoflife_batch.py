@@ -0,0 +1,186 @@
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+import torch
+
+from gameoflife_headless import parse_rule
+from gameoflife_numpy import rule_table
+
+# Life and the variants of gameoflife2_3-4.py and gameoflife2_2-3_3-4.py
+DEFAULT_RULES = ["B3/S23", "B4/S23", "B4/S34"]
+
+def rule_string(survival_rule, birth_rule):
+    return "B" + "".join(map(str, sorted(birth_rule))) + "/S" + "".join(map(str, sorted(survival_rule)))
+
+class BatchedTorchEngine:
+    """Many independent toroidal universes of one size, stepped together.
+
+    The state is an (N, H, W) uint8 tensor and every universe has its own B/S
+    rule, stored as the bits of the state * 9 + neighbors table of
+    NumpyEngine. A step is the batched box sum and rule lookup of TorchEngine
+    with every buffer preallocated, so N universes cost one set of kernels.
+    """
+
+    def __init__(self, universes, rows, cols, rules, device=None):
+        if len(rules) != universes:
+            raise ValueError(f"Need one (survival, birth) rule per universe, got {len(rules)} for {universes}")
+        self.universes = universes
+        self.rows = rows
+        self.cols = cols
+        self.device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+        uint8 = dict(dtype=torch.uint8, device=self.device)
+        self.grid = torch.zeros((universes, rows, cols), **uint8)
+        self.next_grid = torch.zeros((universes, rows, cols), **uint8)
+        self.padded = torch.zeros((universes, rows + 2, cols + 2), **uint8)
+        self.row_sums = torch.zeros((universes, rows + 2, cols), **uint8)
+        self.counts = torch.zeros((universes, rows, cols), **uint8)
+        self.index = torch.zeros((universes, rows, cols), dtype=torch.int32, device=self.device)
+        self.generation = 0
+        self.set_rules(rules)
+
+    def set_rules(self, rules):
+        self.rules = [(tuple(survival), tuple(birth)) for survival, birth in rules]
+        bits = []
+        for survival, birth in self.rules:
+            bits.append(sum(1 << i for i, alive in enumerate(rule_table(survival, birth)) if alive))
+        self.rule_bits = torch.tensor(bits, dtype=torch.int32, device=self.device).view(-1, 1, 1)
+
+    def load(self, grids):
+        if not isinstance(grids, torch.Tensor):
+            grids = torch.as_tensor(np.asarray(grids, dtype=np.uint8))
+        self.grid.copy_(grids.reshape(self.universes, self.rows, self.cols))
+        self.generation = 0
+
+    def randomize(self, seeds, density=0.5):
+        """Fill universe i with a random soup from seeds[i], reproducible per seed."""
+        generator = torch.Generator()
+        for i, seed in enumerate(seeds):
+            generator.manual_seed(seed)
+            soup = torch.rand((self.rows, self.cols), generator=generator) < density
+            self.grid[i].copy_(soup)
+        self.generation = 0
+
+    def step(self, generations=1):
+        p, row_sums, counts, index = self.padded, self.row_sums, self.counts, self.index
+        for _ in range(generations):
+            p[:, 1:-1, 1:-1].copy_(self.grid)
+            p[:, 0, 1:-1].copy_(self.grid[:, -1])
+            p[:, -1, 1:-1].copy_(self.grid[:, 0])
+            p[:, :, 0].copy_(p[:, :, -2])
+            p[:, :, -1].copy_(p[:, :, 1])
+
+            torch.add(p[:, :, :-2], p[:, :, 1:-1], out=row_sums)
+            row_sums.add_(p[:, :, 2:])
+            torch.add(row_sums[:, :-2], row_sums[:, 1:-1], out=counts)
+            counts.add_(row_sums[:, 2:])
+            # 3x3 total + 8 * state == state * 9 + neighbors, the bit of rule_bits to read
+            counts.add_(self.grid, alpha=8)
+            index.copy_(counts)
+            torch.bitwise_right_shift(self.rule_bits, index, out=index)
+            index.bitwise_and_(1)
+            self.next_grid.copy_(index)
+
+            self.grid, self.next_grid = self.next_grid, self.grid
+            self.generation += 1
+
+    def populations(self):
+        return self.grid.sum(dim=(1, 2), dtype=torch.int32)
+
+    def run(self, generations, record_every=1):
+        """Step generations and return the (samples, N) population curves as a NumPy array.
+
+        Populations are sampled every record_every generations and after the
+        last generation. They are collected on the device and copied to the
+        host once at the end, so a GPU never waits for the CPU in between.
+        """
+        generations_at = sample_generations(generations, record_every)
+        curves = torch.zeros((len(generations_at), self.universes), dtype=torch.int32, device=self.device)
+        curves[0] = self.populations()
+        for sample in range(1, len(generations_at)):
+            self.step(generations_at[sample] - generations_at[sample - 1])
+            curves[sample] = self.populations()
+        return curves.cpu().numpy()
+
+    def snapshot(self):
+        return self.grid.cpu().numpy()
+
+def sample_generations(generations, record_every):
+    """Generations BatchedTorchEngine.run samples: every record_every, plus the last one."""
+    samples = list(range(0, generations + 1, record_every))
+    if samples[-1] != generations:
+        samples.append(generations)
+    return samples
+
+def random_rules(count, seed):
+    """Random B/S rules without B0, which would flood the torus every other step."""
+    rng = random.Random(seed)
+    rules = []
+    for _ in range(count):
+        birth = [n for n in range(1, 9) if rng.random() < 0.3]
+        survival = [n for n in range(9) if rng.random() < 0.3]
+        rules.append((survival, birth))
+    return rules
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep Game of Life rules and seeds in one batch")
+    parser.add_argument("--rules", default=",".join(DEFAULT_RULES), help="Comma separated rules like B3/S23")
+    parser.add_argument("--random-rules", type=int, default=0, help="Add this many random rules")
+    parser.add_argument("--seeds", type=int, default=8, help="Random soups per rule")
+    parser.add_argument("--seed", type=int, default=1, help="Base seed for the soups and random rules")
+    parser.add_argument("--density", type=float, default=0.5)
+    parser.add_argument("--rows", type=int, default=64)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--generations", type=int, default=500)
+    parser.add_argument("--record-every", type=int, default=1, help="Generations between population samples")
+    parser.add_argument("--device", help="torch device, default cuda if available")
+    parser.add_argument("--output", default="sweep.npz", help="Population curves and final states")
+    args = parser.parse_args(argv)
+    if args.record_every < 1:
+        parser.error("--record-every must be at least 1")
+    if args.seeds < 1:
+        parser.error("--seeds must be at least 1")
+    if args.generations < 0:
+        parser.error("--generations must be 0 or more")
+
+    rules = []
+    for rule in args.rules.split(",") if args.rules else []:
+        try:
+            rules.append(parse_rule(rule))
+        except ValueError as e:
+            parser.error(str(e))
+    rules += random_rules(args.random_rules, args.seed)
+
+    # Every rule runs on the same soups, so rules can be compared seed by seed
+    universe_rules = [rule for rule in rules for _ in range(args.seeds)]
+    seeds = [args.seed + i for _ in rules for i in range(args.seeds)]
+    engine = BatchedTorchEngine(len(universe_rules), args.rows, args.cols, universe_rules, args.device)
+    engine.randomize(seeds, args.density)
+    print(f"{len(universe_rules)} universes of {args.rows}x{args.cols} on {engine.device}")
+
+    start = time.perf_counter()
+    curves = engine.run(args.generations, args.record_every)
+    elapsed = time.perf_counter() - start
+    cells = len(universe_rules) * args.rows * args.cols * args.generations
+    print(f"Ran {args.generations} generations in {elapsed:.3f}s ({cells / elapsed:.3g} cell updates/s)")
+
+    names = [rule_string(survival, birth) for survival, birth in rules]
+    final = engine.populations().cpu().numpy().reshape(len(rules), args.seeds)
+    shown = 20  # Rules sorted by mean final population, the rest is in the output file
+    order = np.argsort(-final.mean(axis=1), kind="stable")
+    for name, populations in [(names[i], final[i]) for i in order[:shown]]:
+        print(f"{name:>20}: final population mean {populations.mean():.1f}, "
+              f"min {populations.min()}, max {populations.max()}")
+    if len(names) > shown:
+        print(f"... {len(names) - shown} more rules")
+
+    np.savez_compressed(args.output, populations=curves, final_states=engine.snapshot(),
+                        rules=np.array([rule_string(*rule) for rule in universe_rules]), seeds=np.array(seeds),
+                        generations=np.array(sample_generations(args.generations, args.record_every)))
+    print(f"Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+import argparse
+import importlib
+import json
+import multiprocessing as mp
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Peak memory is reported as None where getrusage is missing
+    resource = None
+
+from gameoflife_headless import ENGINES
+
+# Same shape as GLIDER_PATTERN in gameoflife_3d_opengl_2.py / _3.py, which
+# cannot be imported here without pygame and OpenGL
+GLIDER_PATTERN = [
+    (0, 0, 0), (1, 0, 0), (0, 1, 0), (2, 0, 0), (1, 2, 0),
+    (0, 0, 4), (1, 0, 4), (0, 1, 4), (1, 1, 4),
+    (0, 0, 8), (1, 0, 8), (2, 0, 8)
+]
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+GOSPER_GLIDER_GUN = [
+    "........................O...........",
+    "......................O.O...........",
+    "............OO......OO............OO",
+    "...........O...O....OO............OO",
+    "OO........O.....O...OO..............",
+    "OO........O...O.OO....O.O...........",
+    "..........O.....O.......O...........",
+    "...........O...O....................",
+    "............OO......................",
+]
+GUN = [(r, c) for r, line in enumerate(GOSPER_GLIDER_GUN) for c, char in enumerate(line) if char == "O"]
+
+WORKLOADS = ["glider", "soup", "gun", "glider3d"]
+SIZES = [64, 256, 1024, 4096, 8192]
+SIZES_3D = [20, 32, 64, 128]
+
+# 3D engines take (size, survival_min, survival_max, birth_min, birth_max)
+ENGINES_3D = {
+    "python3d": ("gameoflife_benchmark", "Python3DEngine"),
+    "numpy3d": ("gameoflife_3d_numpy", "Numpy3DEngine"),
+    "sparse3d": ("gameoflife_3d_sparse", "Sparse3DEngine"),
+    "bitpacked3d": ("gameoflife_3d_bitpacked", "BitPacked3DEngine"),
+}
+
+# Largest board edge each slow engine is run at unless --all-sizes is given
+MAX_SIZE = {
+    "python": 512,
+    "sparse": 2048,
+    "hashlife": 2048,
+    "tiled": 4096,
+    "python3d": 32,
+}
+
+class Python3DEngine:
+    """The update_grid loop of the 3D OpenGL apps: no wrapping, min/max rules."""
+
+    def __init__(self, size, survival_min=2, survival_max=3, birth_min=3, birth_max=3):
+        self.size = size
+        self.survival_min, self.survival_max = survival_min, survival_max
+        self.birth_min, self.birth_max = birth_min, birth_max
+        self.grid = np.zeros((size, size, size), dtype=int)
+
+    def load(self, grid):
+        self.grid = np.array(grid, dtype=int)
+
+    def count_neighbors(self, x, y, z):
+        size, grid = self.size, self.grid
+        count = 0
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                for k in range(-1, 2):
+                    if i == 0 and j == 0 and k == 0:
+                        continue
+                    nx, ny, nz = x + i, y + j, z + k
+                    if 0 <= nx < size and 0 <= ny < size and 0 <= nz < size:
+                        count += grid[nx, ny, nz]
+        return count
+
+    def step(self, generations=1):
+        size = self.size
+        for _ in range(generations):
+            new_grid = np.zeros((size, size, size), dtype=int)
+            for x in range(size):
+                for y in range(size):
+                    for z in range(size):
+                        neighbors = self.count_neighbors(x, y, z)
+                        if self.grid[x, y, z] == 1:
+                            if self.survival_min <= neighbors <= self.survival_max:
+                                new_grid[x, y, z] = 1
+                        elif self.birth_min <= neighbors <= self.birth_max:
+                            new_grid[x, y, z] = 1
+            self.grid = new_grid
+
+    def snapshot(self):
+        return self.grid
+
+    def population(self):
+        return int(np.count_nonzero(self.grid))
+
+def build_workload(workload, size, seed):
+    if workload == "glider3d":
+        grid = np.zeros((size, size, size), dtype=np.uint8)
+        center = size // 2
+        for dx, dy, dz in GLIDER_PATTERN:
+            grid[center + dx, center + dy, center + dz] = 1
+        return grid
+    grid = np.zeros((size, size), dtype=np.uint8)
+    if workload == "soup":
+        grid[:] = np.random.default_rng(seed).random((size, size)) < 0.5
+        return grid
+    cells = GLIDER if workload == "glider" else GUN
+    height = max(r for r, _ in cells) + 1
+    width = max(c for _, c in cells) + 1
+    if height > size or width > size:
+        return None
+    top, left = (size - height) // 2, (size - width) // 2
+    for r, c in cells:
+        grid[top + r, left + c] = 1
+    return grid
+
+def max_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def run_case(engine_name, workload, size, generations, seconds, seed, results):
+    """Benchmark one engine on one workload in a fresh process and put the result on results."""
+    result = {"engine": engine_name, "workload": workload, "size": size}
+    try:
+        module_name, class_name = (ENGINES_3D if workload == "glider3d" else ENGINES)[engine_name]
+        engine_class = getattr(importlib.import_module(module_name), class_name)
+        # Measured after the import so e.g. torch itself is not counted
+        baseline = max_rss_mb()
+        grid = build_workload(workload, size, seed)
+        if grid is None:
+            result.update({"status": "skipped", "error": "pattern does not fit the board"})
+            results.put(result)
+            return
+        if workload == "glider3d":
+            engine = engine_class(size, 2, 3, 3, 3)
+            cells = size ** 3
+        else:
+            engine = engine_class(size, size, (2, 3), (3,))
+            cells = size * size
+        engine.load(grid)
+        del grid
+
+        engine.step(1)  # Warm up caches, lazily built tables and torch kernels
+        times = []
+        start = time.perf_counter()
+        while len(times) < generations and time.perf_counter() - start < seconds:
+            t0 = time.perf_counter()
+            engine.step(1)
+            times.append(time.perf_counter() - t0)
+        total = sum(times)
+        population = engine.population()
+        if hasattr(engine, "close"):
+            engine.close()
+
+        peak = max_rss_mb()
+        times.sort()
+        result.update({
+            "status": "ok",
+            "generations": len(times),
+            "seconds": round(total, 6),
+            "generations_per_sec": round(len(times) / total, 3) if total > 0 else None,
+            "cell_updates_per_sec": round(len(times) * cells / total) if total > 0 else None,
+            "latency_ms": {
+                "p50": round(percentile(times, 0.50) * 1000, 4),
+                "p90": round(percentile(times, 0.90) * 1000, 4),
+                "p99": round(percentile(times, 0.99) * 1000, 4),
+                "max": round(times[-1] * 1000, 4),
+            },
+            "peak_memory_mb": round(peak - baseline, 2) if peak is not None else None,
+            "population": population,
+        })
+    except Exception as e:
+        result.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    results.put(result)
+
+def git_version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, old_path, threshold):
+    """Print cases whose cell-updates/sec dropped below threshold times the old run."""
+    with open(old_path) as f:
+        old = {(r["engine"], r["workload"], r["size"]): r for r in json.load(f)["results"]}
+    regressions = 0
+    for r in results:
+        before = old.get((r["engine"], r["workload"], r["size"]))
+        if not before or r["status"] != "ok" or before.get("status") != "ok":
+            continue
+        ratio = r["cell_updates_per_sec"] / before["cell_updates_per_sec"]
+        if ratio < threshold:
+            regressions += 1
+            print(f"Regression: {r['engine']} {r['workload']} {r['size']}: {ratio:.2f}x of {old_path}")
+    print(f"{regressions} regression(s) against {old_path}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the Game of Life engines")
+    parser.add_argument("--engines", help="Comma separated engine names (default: all)")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Board edges of the 2D workloads")
+    parser.add_argument("--sizes-3d", default=",".join(map(str, SIZES_3D)), help="Cube edges of glider3d")
+    parser.add_argument("--generations", type=int, default=200, help="Most generations timed per case")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Time budget per case")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Kill a case after this many seconds")
+    parser.add_argument("--all-sizes", action="store_true", help="Also run slow engines on large boards")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--compare", help="Earlier JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.9,
+                        help="Report cases slower than this fraction of the --compare run")
+    args = parser.parse_args(argv)
+
+    engines = args.engines.split(",") if args.engines else sorted(ENGINES) + sorted(ENGINES_3D)
+    workloads = args.workloads.split(",")
+    sizes = [int(s) for s in args.sizes.split(",")]
+    sizes_3d = [int(s) for s in args.sizes_3d.split(",")]
+
+    # Every case gets its own process, so peak memory and crashes stay per case
+    ctx = mp.get_context("spawn")
+    results = []
+    for workload in workloads:
+        is_3d = workload == "glider3d"
+        for engine_name in engines:
+            if (engine_name in ENGINES_3D) != is_3d:
+                continue
+            for size in sizes_3d if is_3d else sizes:
+                if size > MAX_SIZE.get(engine_name, size) and not args.all_sizes:
+                    continue
+                queue = ctx.Queue()
+                process = ctx.Process(target=run_case, args=(engine_name, workload, size, args.generations,
+                                                             args.seconds, args.seed, queue))
+                process.start()
+                try:
+                    result = queue.get(timeout=args.timeout)
+                except Exception:
+                    result = {"engine": engine_name, "workload": workload, "size": size, "status": "timeout"}
+                    process.terminate()
+                process.join()
+                results.append(result)
+
+                if result["status"] == "ok":
+                    latency = result["latency_ms"]
+                    print(f"{engine_name:>12} {workload:>8} {size:>5}: {result['cell_updates_per_sec']:.3g} "
+                          f"cell updates/s, p50 {latency['p50']:.3f} ms, p99 {latency['p99']:.3f} ms, "
+                          f"{result['peak_memory_mb']} MB")
+                else:
+                    print(f"{engine_name:>12} {workload:>8} {size:>5}: {result['status']} {result.get('error', '')}")
+
+    report = {
+        "version": git_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "cpus": mp.cpu_count(),
+        "generations": args.generations,
+        "seconds": args.seconds,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
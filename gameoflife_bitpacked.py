@@ -0,0 +1,109 @@
+import numpy as np
+
+WORD_BITS = 64
+
+class BitPackedEngine:
+    """Toroidal Game of Life engine storing 64 cells per uint64 word.
+
+    Column c of a row lives in word c // 64, bit c % 64. Neighbor counts are
+    computed for all 64 cells of a word at once with bitwise adders.
+    """
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,)):
+        self.rows = rows
+        self.cols = cols
+        self.words = (cols + WORD_BITS - 1) // WORD_BITS
+        self.cells = np.zeros((rows, self.words), dtype=np.uint64)
+        self.rules = None
+
+        # Bits of the last word that hold real columns, padding must stay 0
+        self.last_bit = np.uint64((cols - 1) % WORD_BITS)
+        self.mask = np.full(self.words, ~np.uint64(0), dtype=np.uint64)
+        self.mask[-1] = ~np.uint64(0) >> np.uint64(WORD_BITS - 1 - int(self.last_bit))
+
+        # Dense view handed out by snapshot(), sized to whole words for unpacking
+        self.unpacked = np.zeros((rows, self.words * WORD_BITS), dtype=np.uint8)
+        self.set_rules(survival_rule, birth_rule)
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        self.rules = rules
+        self.survival_counts = sorted(set(survival_rule))
+        self.birth_counts = sorted(set(birth_rule))
+
+    def load(self, grid):
+        dense = np.zeros((self.rows, self.words * WORD_BITS), dtype=np.uint8)
+        dense[:, :self.cols] = np.asarray(grid, dtype=np.uint8)
+        packed = np.packbits(dense, axis=1, bitorder="little")
+        self.cells = packed.view("<u8").astype(np.uint64)
+
+    def snapshot(self):
+        cells = self.cells.astype("<u8", copy=False)  # no-op on little-endian hosts
+        self.unpacked[:] = np.unpackbits(cells.view(np.uint8), axis=1, bitorder="little")
+        return self.unpacked[:, :self.cols]
+
+    def shift_west(self, x):
+        # result[c] = x[c - 1], column 0 wraps around to the last column
+        out = x << np.uint64(1)
+        out[:, 1:] |= x[:, :-1] >> np.uint64(WORD_BITS - 1)
+        out[:, 0] |= (x[:, -1] >> self.last_bit) & np.uint64(1)
+        out &= self.mask
+        return out
+
+    def shift_east(self, x):
+        # result[c] = x[c + 1], the last column wraps around to column 0
+        out = x >> np.uint64(1)
+        out[:, :-1] |= x[:, 1:] << np.uint64(WORD_BITS - 1)
+        out[:, -1] |= (x[:, 0] & np.uint64(1)) << self.last_bit
+        out &= self.mask
+        return out
+
+    def count_bits(self, x):
+        # Neighbor count of every cell as four bit planes (1, 2, 4, 8)
+        west = self.shift_west(x)
+        east = self.shift_east(x)
+
+        # Horizontal sums: 3 cells for the rows above/below, 2 for the own row
+        h0 = west ^ x ^ east
+        h1 = (west & x) | (west & east) | (x & east)
+        m0 = west ^ east
+        m1 = west & east
+
+        up0, up1 = np.roll(h0, 1, axis=0), np.roll(h1, 1, axis=0)
+        down0, down1 = np.roll(h0, -1, axis=0), np.roll(h1, -1, axis=0)
+
+        # Full adder on the ones, then add the twos together with the carry
+        s0 = up0 ^ m0 ^ down0
+        carry = (up0 & m0) | (up0 & down0) | (m0 & down0)
+        t = up1 ^ m1 ^ down1
+        u = (up1 & m1) | (up1 & down1) | (m1 & down1)
+        s1 = t ^ carry
+        v = t & carry
+        s2 = u ^ v
+        s3 = u & v
+        return s0, s1, s2, s3
+
+    def count_equals(self, bits, n):
+        result = None
+        for i, plane in enumerate(bits):
+            match = plane if (n >> i) & 1 else ~plane
+            result = match if result is None else result & match
+        return result
+
+    def step(self, generations=1):
+        zero = np.zeros_like(self.cells)
+        for _ in range(generations):
+            x = self.cells
+            bits = self.count_bits(x)
+            survive = zero
+            for n in self.survival_counts:
+                survive = survive | self.count_equals(bits, n)
+            birth = zero
+            for n in self.birth_counts:
+                birth = birth | self.count_equals(bits, n)
+            self.cells = ((x & survive) | (~x & birth)) & self.mask
+
+    def population(self):
+        return int(np.unpackbits(self.cells.view(np.uint8)).sum())
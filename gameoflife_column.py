@@ -0,0 +1,110 @@
+import torch
+
+# Whole-tensor versions of the next_generation rules of gameoflife_gpu6.py to
+# gameoflife_gpu9.py. Each reads only the old grid, so every cell can be
+# computed at once. Sums are added in the order of the original loops to give
+# bit-identical float32 results, which test_gameoflife_column.py confirms
+# against the original per-cell loops.
+
+def shifted_down(grid):
+    """grid[row - 1], with 0.0 above the top row."""
+    out = torch.zeros_like(grid)
+    out[1:] = grid[:-1]
+    return out
+
+def shifted_up(grid):
+    """grid[row + 1], with 0.0 below the bottom row."""
+    out = torch.zeros_like(grid)
+    out[:-1] = grid[1:]
+    return out
+
+def left_average_step(grid):
+    """gameoflife_gpu6.py: add the average of the left, above and below neighbors."""
+    new_grid = grid.clone()
+    cells = grid[:, 1:]
+    avg = (grid[:, :-1] + shifted_down(cells) + shifted_up(cells)) / 3
+    new_val = cells + avg
+    new_grid[:, 1:] = torch.where(new_val > 1.0, 0.0, torch.round(new_val * 10) / 10)
+    return new_grid
+
+def left_diagonal_average_step(grid):
+    """gameoflife_gpu7.py: add the average of the three cells of the previous column, then decay."""
+    new_grid = grid.clone()
+    previous = grid[:, :-1]
+    avg = (previous + shifted_down(previous) + shifted_up(previous)) / 3
+    current = grid[:, 1:]
+    current = torch.where(current == 1.0, 0.0, current)
+    new_grid[:, 1:] = torch.clamp(current + avg, max=1.0)
+    new_grid = torch.maximum(new_grid - 0.1, torch.tensor(0.0, device=grid.device))
+    return torch.round(new_grid * 10) / 10
+
+def push_right_step(grid):
+    """gameoflife_gpu8.py: cells >= 0.5 push 0.1 to their right and right diagonal neighbors."""
+    pushing = grid >= 0.5
+    push = torch.where(pushing, 0.1, 0.0)
+    # Scatter-add in the loop's row order: from the row above, the same row, the row below
+    changes = torch.zeros_like(grid)
+    changes[1:, 1:] += push[:-1, :-1]
+    changes[:, 1:] += push[:, :-1]
+    changes[:-1, 1:] += push[1:, :-1]
+    new_grid = torch.where(pushing, torch.clamp(grid - 0.1, min=0.0), grid)
+    new_grid = new_grid + changes
+    new_grid = torch.maximum(new_grid - 0.1, torch.tensor(0.0, device=grid.device))
+    return torch.round(new_grid * 10) / 10
+
+def push_right_binary_step(grid):
+    """gameoflife_gpu9.py: live cells move to their right and right diagonal neighbors."""
+    alive = grid == 1
+    pushed = torch.zeros_like(alive)
+    pushed[:, 1:] |= alive[:, :-1]
+    pushed[1:, 1:] |= alive[:-1, :-1]
+    pushed[:-1, 1:] |= alive[1:, :-1]
+    # A live cell is cleared after anything pushed into it, as the loop visits columns left to right
+    return torch.where(alive, torch.zeros_like(grid), torch.where(pushed, torch.ones_like(grid), grid))
+
+class ColumnSweepEngine:
+    """gameoflife_gpu7.py's rule computed one whole column per tensor op.
+
+    Columns are stored contiguously as (strips, cols, rows), so column col of
+    every strip is one (strips, rows) slice and many independent strips
+    advance in the same cols - 1 ops per generation. With sweep=True each
+    column reads the already updated column to its left, so a change travels
+    the whole strip in one generation. Otherwise it reads the old grid like
+    left_diagonal_average_step.
+    """
+
+    def __init__(self, strips, rows, cols, device=None, sweep=False):
+        self.strips = strips
+        self.rows = rows
+        self.cols = cols
+        self.sweep = sweep
+        self.device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+        self.columns = torch.zeros((strips, cols, rows), dtype=torch.float32, device=self.device)
+        self.next_columns = torch.zeros_like(self.columns)
+        self.padded = torch.zeros((strips, rows + 2), dtype=torch.float32, device=self.device)
+        self.zero = torch.tensor(0.0, device=self.device)
+
+    def load(self, grid):
+        """Load one (rows, cols) grid into every strip, or a (strips, rows, cols) batch."""
+        grid = torch.as_tensor(grid, dtype=torch.float32, device=self.device)
+        self.columns.copy_(grid.transpose(-1, -2).expand(self.strips, self.cols, self.rows))
+
+    def step(self, generations=1):
+        p = self.padded
+        for _ in range(generations):
+            src, dst = self.columns, self.next_columns
+            dst[:, 0] = src[:, 0]
+            for col in range(1, self.cols):
+                # Rows above and below come from a zero padded copy of the previous column
+                p[:, 1:-1] = dst[:, col - 1] if self.sweep else src[:, col - 1]
+                avg = (p[:, 1:-1] + p[:, :-2] + p[:, 2:]) / 3
+                current = torch.where(src[:, col] == 1.0, self.zero, src[:, col])
+                torch.clamp(current + avg, max=1.0, out=dst[:, col])
+            torch.maximum(dst - 0.1, self.zero, out=dst)
+            dst.mul_(10).round_().div_(10)
+            self.columns, self.next_columns = dst, src
+
+    def snapshot(self):
+        """The strips as a (strips, rows, cols) tensor, or (rows, cols) for a single strip."""
+        grid = self.columns.transpose(1, 2).contiguous()
+        return grid[0] if self.strips == 1 else grid
@@ -0,0 +1,142 @@
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+from OpenGL.error import GLError
+
+# The 12 triangles of a unit cube centered on the origin, like glutSolidCube(1.0)
+CUBE_CORNERS = np.array([(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)], dtype=np.float32)
+CUBE_TRIANGLES = [
+    0, 1, 3, 0, 3, 2,  # x = -0.5
+    4, 6, 7, 4, 7, 5,  # x = +0.5
+    0, 4, 5, 0, 5, 1,  # y = -0.5
+    2, 3, 7, 2, 7, 6,  # y = +0.5
+    0, 2, 6, 0, 6, 4,  # z = -0.5
+    1, 5, 7, 1, 7, 3,  # z = +0.5
+]
+CUBE_VERTICES = CUBE_CORNERS[CUBE_TRIANGLES]
+
+# Fixed-function style shader: one cube mesh moved by a per-instance offset
+VERTEX_SHADER = """
+#version 120
+attribute vec3 position;
+attribute vec3 offset;
+void main() {
+    gl_FrontColor = gl_Color;
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(position + offset, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+void main() {
+    gl_FragColor = gl_Color;
+}
+"""
+
+class CellRenderer:
+    """Draw every live cell of a 3D grid as a cube with one draw call.
+
+    Live cell positions are uploaded only when the grid changes. With
+    instancing they go to a vertex buffer of per-instance offsets for
+    glDrawArraysInstanced. Otherwise all cubes are expanded into one vertex
+    array for a single glDrawArrays. Create it after the GL context exists.
+    """
+
+    def __init__(self, grid_size, color=(0.0, 0.0, 1.0, 0.8)):
+        self.grid_size = grid_size
+        self.color = color
+        self.uploaded = None  # Copy of the grid the GPU data was built from
+        self.count = 0
+        self.program = None
+        self.instanced = bool(glDrawArraysInstanced) and bool(glVertexAttribDivisor)
+        if self.instanced:
+            try:
+                self.create_buffers()
+            except (RuntimeError, GLError) as e:  # Shaders not supported or failed to compile
+                print(f"Instanced cell rendering unavailable, using a vertex array: {e}")
+                self.instanced = False
+        self.vertices = None
+        print(f"Cell rendering: {'instanced' if self.instanced else 'batched vertex array'}")
+
+    def create_buffers(self):
+        self.program = shaders.compileProgram(shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+                                              shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER))
+        self.position_location = glGetAttribLocation(self.program, "position")
+        self.offset_location = glGetAttribLocation(self.program, "offset")
+        self.cube_buffer, self.offset_buffer = glGenBuffers(2)
+        glBindBuffer(GL_ARRAY_BUFFER, self.cube_buffer)
+        glBufferData(GL_ARRAY_BUFFER, CUBE_VERTICES.nbytes, CUBE_VERTICES, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.uploaded = None
+
+    def update(self, grid):
+        if self.uploaded is not None and self.uploaded.shape == grid.shape and np.array_equal(self.uploaded, grid):
+            return
+        self.uploaded = np.array(grid, copy=True)
+        # Same cell centers as the glTranslatef of the old per-cell loop
+        offsets = (np.argwhere(grid == 1) - self.grid_size / 2 + 0.5).astype(np.float32)
+        self.count = len(offsets)
+        if self.instanced:
+            glBindBuffer(GL_ARRAY_BUFFER, self.offset_buffer)
+            glBufferData(GL_ARRAY_BUFFER, max(offsets.nbytes, 12), offsets if self.count else None, GL_DYNAMIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        else:
+            self.vertices = np.ascontiguousarray((offsets[:, None, :] + CUBE_VERTICES[None, :, :]).reshape(-1, 3))
+
+    def draw(self, grid):
+        # A new display mode may have come with a new context, without our objects
+        if self.instanced and not glIsProgram(self.program):
+            self.create_buffers()
+        self.update(grid)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor4f(*self.color)
+        if self.count == 0:
+            return
+
+        if self.instanced:
+            glUseProgram(self.program)
+            glBindBuffer(GL_ARRAY_BUFFER, self.cube_buffer)
+            glEnableVertexAttribArray(self.position_location)
+            glVertexAttribPointer(self.position_location, 3, GL_FLOAT, GL_FALSE, 0, None)
+            glBindBuffer(GL_ARRAY_BUFFER, self.offset_buffer)
+            glEnableVertexAttribArray(self.offset_location)
+            glVertexAttribPointer(self.offset_location, 3, GL_FLOAT, GL_FALSE, 0, None)
+            glVertexAttribDivisor(self.offset_location, 1)
+            glDrawArraysInstanced(GL_TRIANGLES, 0, len(CUBE_VERTICES), self.count)
+            glVertexAttribDivisor(self.offset_location, 0)
+            glDisableVertexAttribArray(self.offset_location)
+            glDisableVertexAttribArray(self.position_location)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glUseProgram(0)
+        else:
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(3, GL_FLOAT, 0, self.vertices)
+            glDrawArrays(GL_TRIANGLES, 0, len(self.vertices))
+            glDisableClientState(GL_VERTEX_ARRAY)
+
+class DisplayListCache:
+    """Immediate mode drawing recorded once into display lists and replayed.
+
+    call(name, key, draw, *args) replays the list stored under name while key
+    stays the same, and records draw(*args) into a new list when it changes,
+    for example when GRID_SIZE or the window size does.
+    """
+
+    def __init__(self):
+        self.lists = {}  # name -> (key, display list)
+
+    def call(self, name, key, draw, *args):
+        entry = self.lists.get(name)
+        # A new display mode may also have come with a new context, without our lists
+        if entry is not None and entry[0] == key and glIsList(entry[1]):
+            glCallList(entry[1])
+            return
+        if entry is not None and glIsList(entry[1]):
+            glDeleteLists(entry[1], 1)
+        display_list = glGenLists(1)
+        glNewList(display_list, GL_COMPILE)
+        draw(*args)
+        glEndList()
+        self.lists[name] = (key, display_list)
+        glCallList(display_list)
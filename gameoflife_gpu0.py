@@ -1,6 +1,7 @@
 import tkinter as tk
 import torch
-import numpy as np
+from gameoflife_tkimage import GrayscaleRenderer
+from gameoflife_torch import FrameTransfer
 
 class GameOfLife:
     def __init__(self, root, rows=100, cols=100):
@@ -13,6 +14,7 @@ class GameOfLife:
         # Device setup
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         print(f"Using device: {self.device}")
+        self.transfer = FrameTransfer(self.device)
 
         # Initialize grid
         self.grid = torch.zeros((rows, cols), dtype=torch.float32, device=self.device)
@@ -21,7 +23,7 @@ class GameOfLife:
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
 
         # Buttons
         self.start_button = tk.Button(root, text="Start", command=self.start)
@@ -39,28 +41,12 @@ class GameOfLife:
         self.draw_grid()
         self.update()
 
-    def draw_grid(self):
-        # Convert grid to numpy (0 or 255)
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
-        # Upscale to match cell_size
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        
-        # Convert to RGB (3 channels: 0 for black, 255 for white)
-        rgb_array = np.stack([img_array] * 3, axis=2)  # Shape: (height, width, 3)
-        
-        # Create PPM header
-        height, width = rgb_array.shape[0], rgb_array.shape[1]
-        ppm_header = f'P6\n{width} {height}\n255\n'.encode()
-        
-        # Combine header with RGB data
-        ppm_data = ppm_header + rgb_array.tobytes()
-        
-        # Create PhotoImage
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
+    def draw_grid(self, pipelined=False):
+        # While running, show the previous frame while this one copies to pinned host memory
+        if pipelined:
+            self.renderer.draw(self.transfer.submit(self.grid))
         else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+            self.renderer.draw(self.transfer.fetch(self.grid))
 
     def set_initial_glider(self):
         glider_positions = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
@@ -75,6 +61,7 @@ class GameOfLife:
 
     def stop(self):
         self.running = False
+        self.draw_grid()
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         print("Stop pressed")
@@ -96,7 +83,7 @@ class GameOfLife:
     def update(self):
         if self.running:
             self.next_generation()
-            self.draw_grid()
+            self.draw_grid(pipelined=True)
         self.root.after(50, self.update)
 
 def main():
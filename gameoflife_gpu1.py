@@ -1,7 +1,8 @@
 import tkinter as tk
 import torch
-import numpy as np
 import time
+from gameoflife_tkimage import GrayscaleRenderer
+from gameoflife_torch import FrameTransfer
 
 class GameOfLife:
     def __init__(self, root, rows=100, cols=100):
@@ -12,21 +13,14 @@ class GameOfLife:
         self.running = False
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         print(f"Using device: {self.device}")
+        self.transfer = FrameTransfer(self.device)
         self.grid = torch.zeros((rows, cols), dtype=torch.float32, device=self.device)
         self.set_initial_glider()
         
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
-        
-        # Precompute PPM header
-        self.display_width = cols * self.cell_size
-        self.display_height = rows * self.cell_size
-        self.ppm_header = f'P6\n{self.display_width} {self.display_height}\n255\n'.encode()
-        
-        # Preallocate RGB buffer
-        self.rgb_array = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
         
         # Buttons
         self.start_button = tk.Button(root, text="Start", command=self.start)
@@ -47,18 +41,12 @@ class GameOfLife:
         self.draw_grid()
         self.update()
 
-    def draw_grid(self):
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        self.rgb_array[..., 0] = img_array  # R
-        self.rgb_array[..., 1] = img_array  # G
-        self.rgb_array[..., 2] = img_array  # B
-        ppm_data = self.ppm_header + self.rgb_array.tobytes()
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
+    def draw_grid(self, pipelined=False):
+        # While running, show the previous frame while this one copies to pinned host memory
+        if pipelined:
+            self.renderer.draw(self.transfer.submit(self.grid))
         else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+            self.renderer.draw(self.transfer.fetch(self.grid))
 
     def set_initial_glider(self):
         glider_positions = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
@@ -73,6 +61,7 @@ class GameOfLife:
 
     def stop(self):
         self.running = False
+        self.draw_grid()
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         print("Stop pressed")
@@ -94,7 +83,7 @@ class GameOfLife:
     def update(self):
         if self.running:
             self.next_generation()
-            self.draw_grid()
+            self.draw_grid(pipelined=True)
             self.frame_count += 1
             
             # Check FPS every 5 seconds
@@ -2,6 +2,7 @@ import pygame
 import torch
 import numpy as np
 import time
+from gameoflife_torch import FrameTransfer
 
 class GameOfLife:
     def __init__(self, rows=100, cols=100, cell_size=5):
@@ -14,6 +15,7 @@ class GameOfLife:
         self.running = False
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         print(f"Using device: {self.device}")
+        self.transfer = FrameTransfer(self.device)
         
         self.grid = torch.zeros((rows, cols), dtype=torch.float32, device=self.device)
         self.set_initial_glider()
@@ -33,7 +35,8 @@ class GameOfLife:
             self.grid[y, x] = 1
     
     def draw_grid(self):
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
+        # Shows the previous frame while this one copies to pinned host memory
+        grid_np = (self.transfer.submit(self.grid) * 255).astype(np.uint8)
         surface = pygame.surfarray.make_surface(np.stack([grid_np]*3, axis=-1))
         surface = pygame.transform.scale(surface, (self.width, self.height - 50))
         self.screen.blit(surface, (0, 0))
@@ -3,6 +3,8 @@ import torch
 import numpy as np
 import time
 from tkinter import ttk
+from gameoflife_tkimage import GrayscaleRenderer
+from gameoflife_torch import FrameTransfer, TorchEngine
 
 class GameOfLife:
     def __init__(self, root, rows=100, cols=100):
@@ -13,23 +15,18 @@ class GameOfLife:
         self.running = False
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         print(f"Using device: {self.device}")
-        self.grid = torch.zeros((rows, cols), dtype=torch.float32, device=self.device)
+        self.transfer = FrameTransfer(self.device)
+        # uint8 state stepped in preallocated buffers, borders count as dead cells
+        self.engine = TorchEngine(rows, cols, device=self.device, wrap=False)
+        self.grid = self.engine.grid
         self.set_initial_glider()
         
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
         self.canvas.bind("<Button-1>", self.add_pixel)  # Bind left mouse click
         
-        # Precompute PPM header
-        self.display_width = cols * self.cell_size
-        self.display_height = rows * self.cell_size
-        self.ppm_header = f'P6\n{self.display_width} {self.display_height}\n255\n'.encode()
-        
-        # Preallocate RGB buffer
-        self.rgb_array = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
-        
         # Control frame
         control_frame = ttk.Frame(root)
         control_frame.pack(pady=5)
@@ -50,34 +47,32 @@ class GameOfLife:
         self.glider_count_entry = ttk.Entry(control_frame, textvariable=self.glider_count_var, width=5)
         self.glider_count_entry.pack(side=tk.LEFT, padx=5)
         
+        # Generations stepped on the device between two drawn frames
+        ttk.Label(control_frame, text="Gens/frame:").pack(side=tk.LEFT, padx=5)
+        self.gens_per_frame_var = tk.StringVar(value="1")
+        self.gens_per_frame_spinbox = ttk.Spinbox(control_frame, from_=1, to=1000, width=5,
+                                                  textvariable=self.gens_per_frame_var)
+        self.gens_per_frame_spinbox.pack(side=tk.LEFT, padx=5)
+        
         # FPS panel
         self.fps_var = tk.StringVar(value="FPS: 0.00")
         self.fps_label = ttk.Label(control_frame, textvariable=self.fps_var)
         self.fps_label.pack(side=tk.LEFT, padx=5)
         
-        # Convolution kernel
-        self.kernel = torch.ones(1, 1, 3, 3, device=self.device)
-        self.kernel[0, 0, 1, 1] = 0
-        
         # FPS tracking
         self.frame_count = 0
+        self.generation_count = 0
         self.last_time = time.time()
         
         self.draw_grid()
         self.update()
 
-    def draw_grid(self):
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        self.rgb_array[..., 0] = img_array  # R
-        self.rgb_array[..., 1] = img_array  # G
-        self.rgb_array[..., 2] = img_array  # B
-        ppm_data = self.ppm_header + self.rgb_array.tobytes()
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
+    def draw_grid(self, pipelined=False):
+        # While running, show the previous frame while this one copies to pinned host memory
+        if pipelined:
+            self.renderer.draw(self.transfer.submit(self.grid))
         else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+            self.renderer.draw(self.transfer.fetch(self.grid))
 
     def set_initial_glider(self):
         glider_positions = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
@@ -94,7 +89,7 @@ class GameOfLife:
             
         glider_pattern = torch.tensor([[0, 1, 0],
                                     [0, 0, 1],
-                                    [1, 1, 1]], dtype=torch.float32, device=self.device)
+                                    [1, 1, 1]], dtype=torch.uint8, device=self.device)
         
         for _ in range(count):
             # Random position ensuring glider fits within grid
@@ -119,6 +114,7 @@ class GameOfLife:
 
     def stop(self):
         self.running = False
+        self.draw_grid()
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         print("Stop pressed")
@@ -132,24 +128,33 @@ class GameOfLife:
         self.stop_button.config(state="disabled")
         print("Clear pressed")
 
-    def next_generation(self):
-        grid = self.grid.unsqueeze(0).unsqueeze(0)
-        neighbors = torch.nn.functional.conv2d(grid, self.kernel, padding=1).squeeze(0).squeeze(0)
-        self.grid = torch.where(self.grid == 1, (neighbors == 2) | (neighbors == 3), (neighbors == 3)).float()
+    def next_generation(self, generations=1):
+        # All generations run on the device, the grid is only copied back by draw_grid
+        self.engine.step(generations)
+        self.grid = self.engine.grid
+
+    def generations_per_frame(self):
+        try:
+            return max(1, int(self.gens_per_frame_var.get()))
+        except ValueError:
+            return 1
 
     def update(self):
         if self.running:
-            self.next_generation()
-            self.draw_grid()
+            generations = self.generations_per_frame()
+            self.next_generation(generations)
+            self.draw_grid(pipelined=True)
             self.frame_count += 1
+            self.generation_count += generations
             
             # Update FPS every 0.5 seconds
             current_time = time.time()
             elapsed = current_time - self.last_time
             if elapsed >= 0.5:
                 fps = self.frame_count / elapsed
-                self.fps_var.set(f"FPS: {fps:.2f}")
+                self.fps_var.set(f"FPS: {fps:.2f}  Gen/s: {self.generation_count / elapsed:.0f}")
                 self.frame_count = 0
+                self.generation_count = 0
                 self.last_time = current_time
         
         self.root.after(50, self.update)
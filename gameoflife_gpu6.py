@@ -1,8 +1,9 @@
 import tkinter as tk
 import torch
-import numpy as np
 import time
 from tkinter import ttk
+from gameoflife_column import left_average_step
+from gameoflife_tkimage import GrayscaleRenderer
 
 class CellularAutomaton:
     def __init__(self, root, rows=10, cols=100):
@@ -21,15 +22,7 @@ class CellularAutomaton:
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
-        
-        # Precompute PPM header
-        self.display_width = cols * self.cell_size
-        self.display_height = rows * self.cell_size
-        self.ppm_header = f'P6\n{self.display_width} {self.display_height}\n255\n'.encode()
-        
-        # Preallocate RGB buffer
-        self.rgb_array = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
         
         # Control frame
         control_frame = ttk.Frame(root)
@@ -56,17 +49,7 @@ class CellularAutomaton:
         self.update()
 
     def draw_grid(self):
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        self.rgb_array[..., 0] = img_array
-        self.rgb_array[..., 1] = img_array
-        self.rgb_array[..., 2] = img_array
-        ppm_data = self.ppm_header + self.rgb_array.tobytes()
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
-        else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+        self.renderer.draw(self.grid.cpu().numpy())
 
     def set_initial_state(self):
         # Set first column: "0001001101"
@@ -96,37 +79,7 @@ class CellularAutomaton:
         print("Reset pressed")
 
     def next_generation(self):
-        # Update from left to right, starting at column 1
-        new_grid = self.grid.clone()
-        
-        for col in range(1, self.cols):
-            for row in range(self.rows):
-                # Get three neighbors: left (col-1, row), above (col, row-1), below (col, row+1)
-                neighbors = torch.zeros(3, device=self.device)
-                
-                # Left neighbor (col-1, row)
-                neighbors[0] = self.grid[row, col - 1]
-                
-                # Above neighbor (col, row-1), use 0.0 if at top edge
-                if row > 0:
-                    neighbors[1] = self.grid[row - 1, col]
-                else:
-                    neighbors[1] = 0.0
-                    
-                # Below neighbor (col, row+1), use 0.0 if at bottom edge
-                if row < self.rows - 1:
-                    neighbors[2] = self.grid[row + 1, col]
-                else:
-                    neighbors[2] = 0.0
-                
-                # Calculate average of the three neighbors
-                avg = torch.sum(neighbors) / 3
-                # Add the average to the current value
-                new_val = self.grid[row, col] + avg
-                # If value exceeds 1.0, set to 0.0; otherwise, round to nearest 0.1
-                new_grid[row, col] = 0.0 if new_val > 1.0 else torch.round(new_val * 10) / 10
-        
-        self.grid = new_grid
+        self.grid = left_average_step(self.grid)
 
     def update(self):
         if self.running:
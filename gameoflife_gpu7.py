@@ -1,11 +1,15 @@
 import tkinter as tk
 import torch
-import numpy as np
 import time
 from tkinter import ttk
+from gameoflife_column import ColumnSweepEngine, left_diagonal_average_step
+from gameoflife_tkimage import GrayscaleRenderer
+
+# Whole grid per op, one column per op, or the same reading the updated left column
+BACKENDS = ["Tensor", "Column", "Column sweep"]
 
 class CellularAutomaton:
-    def __init__(self, root, rows=10, cols=100):
+    def __init__(self, root, rows=10, cols=100, backend="Tensor"):
         self.root = root
         self.rows = rows
         self.cols = cols
@@ -17,19 +21,12 @@ class CellularAutomaton:
         # Initialize grid
         self.grid = torch.zeros((rows, cols), dtype=torch.float32, device=self.device)
         self.set_initial_state()
+        self.column_engine = ColumnSweepEngine(1, rows, cols, device=self.device, sweep=backend == "Column sweep")
         
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
-        
-        # Precompute PPM header
-        self.display_width = cols * self.cell_size
-        self.display_height = rows * self.cell_size
-        self.ppm_header = f'P6\n{self.display_width} {self.display_height}\n255\n'.encode()
-        
-        # Preallocate RGB buffer
-        self.rgb_array = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
         
         # Control frame
         control_frame = ttk.Frame(root)
@@ -43,6 +40,13 @@ class CellularAutomaton:
         self.reset_button = ttk.Button(control_frame, text="Reset", command=self.reset)
         self.reset_button.pack(side=tk.LEFT, padx=5)
         
+        # Backend selection
+        ttk.Label(control_frame, text="Backend:").pack(side=tk.LEFT, padx=5)
+        self.backend_var = tk.StringVar(value=backend)
+        self.backend_menu = ttk.OptionMenu(control_frame, self.backend_var, backend, *BACKENDS,
+                                           command=self.select_backend)
+        self.backend_menu.pack(side=tk.LEFT, padx=5)
+        
         # FPS panel
         self.fps_var = tk.StringVar(value="FPS: 0.00")
         self.fps_label = ttk.Label(control_frame, textvariable=self.fps_var)
@@ -56,17 +60,7 @@ class CellularAutomaton:
         self.update()
 
     def draw_grid(self):
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        self.rgb_array[..., 0] = img_array
-        self.rgb_array[..., 1] = img_array
-        self.rgb_array[..., 2] = img_array
-        ppm_data = self.ppm_header + self.rgb_array.tobytes()
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
-        else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+        self.renderer.draw(self.grid.cpu().numpy())
 
     def set_initial_state(self):
         # Set first column: "0001001101"
@@ -95,45 +89,18 @@ class CellularAutomaton:
         self.stop_button.config(state="disabled")
         print("Reset pressed")
 
+    def select_backend(self, backend):
+        self.column_engine.sweep = backend == "Column sweep"
+        print(f"Backend: {backend}")
+
     def next_generation(self):
-        # Update from left to right, starting at column 1
-        new_grid = self.grid.clone()
-        
-        for col in range(1, self.cols):
-            for row in range(self.rows):
-                # Get three neighbors: left (col-1, row), above (col, row-1), below (col, row+1)
-                neighbors = torch.zeros(3, device=self.device)
-                
-                # Left neighbor (col-1, row)
-                neighbors[0] = self.grid[row, col - 1]
-                
-                # Above neighbor (col, row-1), use 0.0 if at top edge
-                if row > 0:
-                    neighbors[1] = self.grid[row - 1, col - 1]
-                else:
-                    neighbors[1] = 0.0
-                    
-                # Below neighbor (col, row+1), use 0.0 if at bottom edge
-                if row < self.rows - 1:
-                    neighbors[2] = self.grid[row + 1, col-1 ]
-                else:
-                    neighbors[2] = 0.0
-                
-                # Calculate average of the three neighbors
-                avg = torch.sum(neighbors) / 3
-                # Check if current value is 1.0; if so, reset to 0.0 before adding average
-                current_val = self.grid[row, col]
-                if current_val == 1.0:
-                    current_val = 0.0
-                # Add the average to the adjusted value, cap at 1.0
-                new_grid[row, col] = min(1.0, current_val + avg)
-        
-        # Decrease all values by 0.1, floor at 0.0
-        new_grid = torch.maximum(new_grid - 0.1, torch.tensor(0.0, device=self.device))
-        # Round to nearest 0.1 for 10-state precision
-        new_grid = torch.round(new_grid * 10) / 10
-        
-        self.grid = new_grid
+        backend = self.backend_var.get()
+        if backend == "Tensor":
+            self.grid = left_diagonal_average_step(self.grid)
+        else:
+            self.column_engine.load(self.grid)
+            self.column_engine.step()
+            self.grid = self.column_engine.snapshot()
 
     def update(self):
         if self.running:
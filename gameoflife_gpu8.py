@@ -1,8 +1,9 @@
 import tkinter as tk
 import torch
-import numpy as np
 import time
 from tkinter import ttk
+from gameoflife_column import push_right_step
+from gameoflife_tkimage import GrayscaleRenderer
 
 class CellularAutomaton:
     def __init__(self, root, rows=16, cols=100):
@@ -21,15 +22,7 @@ class CellularAutomaton:
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
-        
-        # Precompute PPM header
-        self.display_width = cols * self.cell_size
-        self.display_height = rows * self.cell_size
-        self.ppm_header = f'P6\n{self.display_width} {self.display_height}\n255\n'.encode()
-        
-        # Preallocate RGB buffer
-        self.rgb_array = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
         
         # Control frame
         control_frame = ttk.Frame(root)
@@ -56,17 +49,7 @@ class CellularAutomaton:
         self.update()
 
     def draw_grid(self):
-        grid_np = (self.grid.cpu().numpy() * 255).astype(np.uint8)
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        self.rgb_array[..., 0] = img_array
-        self.rgb_array[..., 1] = img_array
-        self.rgb_array[..., 2] = img_array
-        ppm_data = self.ppm_header + self.rgb_array.tobytes()
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
-        else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+        self.renderer.draw(self.grid.cpu().numpy())
 
     def set_initial_state(self):
         # Set first column: "0001001101"
@@ -103,42 +86,7 @@ class CellularAutomaton:
                                    dtype=torch.float32, device=self.device)
         self.grid[:, 0] = initial_state
 
-        new_grid = self.grid.clone()
-        changes = torch.zeros_like(self.grid, device=self.device)
-        
-        # Process all cells
-        for col in range(self.cols):
-            for row in range(self.rows):
-                current_val = self.grid[row, col]
-                # Push if >= 0.5 to specific neighbors
-                if current_val >= 0.5:
-                    adjustment = 0.1
-                    
-                    # Right neighbor (col+1, row)
-                    if col < self.cols - 1:
-                        changes[row, col + 1] += adjustment
-                    
-                    # Top-right diagonal (col+1, row-1)
-                    if col < self.cols - 1 and row > 0:
-                        changes[row - 1, col + 1] += adjustment
-                    
-                    # Bottom-right diagonal (col+1, row+1)
-                    if col < self.cols - 1 and row < self.rows - 1:
-                        changes[row + 1, col + 1] += adjustment
-                    
-                    # Decrease own value by 0.1 after pushing
-                    new_grid[row, col] = max(0.0, current_val - 0.1)
-        
-        # Apply changes from pushes
-        new_grid = new_grid + changes
-        # If value > 1.0, set to 0.0
-        #new_grid = torch.where(new_grid > 1.0, torch.tensor(0.0, device=self.device), new_grid)
-        # Decrease all cells by 0.1, floor at 0.0
-        new_grid = torch.maximum(new_grid - 0.1, torch.tensor(0.0, device=self.device))
-        # Round to nearest 0.1 for 10-state precision
-        new_grid = torch.round(new_grid * 10) / 10
-        
-        self.grid = new_grid
+        self.grid = push_right_step(self.grid)
 
     def update(self):
         if self.running:
@@ -1,8 +1,9 @@
 import tkinter as tk
 import torch
-import numpy as np
 import time
 from tkinter import ttk
+from gameoflife_column import push_right_binary_step
+from gameoflife_tkimage import GrayscaleRenderer
 
 class CellularAutomaton:
     def __init__(self, root, rows=16, cols=100):
@@ -21,15 +22,7 @@ class CellularAutomaton:
         # Canvas setup
         self.canvas = tk.Canvas(root, width=cols * self.cell_size, height=rows * self.cell_size, bg='white')
         self.canvas.pack(pady=10)
-        self.image = None
-        
-        # Precompute PPM header
-        self.display_width = cols * self.cell_size
-        self.display_height = rows * self.cell_size
-        self.ppm_header = f'P6\n{self.display_width} {self.display_height}\n255\n'.encode()
-        
-        # Preallocate RGB buffer
-        self.rgb_array = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
+        self.renderer = GrayscaleRenderer(self.canvas, rows, cols, self.cell_size)
         
         # Control frame
         control_frame = ttk.Frame(root)
@@ -56,20 +49,7 @@ class CellularAutomaton:
         self.update()
 
     def draw_grid(self):
-        # Convert int8 tensor to numpy array and ensure proper type conversion
-        grid_np = self.grid.cpu().numpy().astype(np.uint8)  # Convert to uint8 first
-        grid_np = grid_np * 255  # Then multiply by 255
-        
-        img_array = np.repeat(np.repeat(grid_np, self.cell_size, axis=0), self.cell_size, axis=1)
-        self.rgb_array[..., 0] = img_array
-        self.rgb_array[..., 1] = img_array
-        self.rgb_array[..., 2] = img_array
-        ppm_data = self.ppm_header + self.rgb_array.tobytes()
-        self.photo = tk.PhotoImage(data=ppm_data, format='PPM')
-        if self.image is None:
-            self.image = self.canvas.create_image(0, 0, image=self.photo, anchor='nw')
-        else:
-            self.canvas.itemconfig(self.image, image=self.photo)
+        self.renderer.draw(self.grid.cpu().numpy())
 
     def set_initial_state(self):
         # Set first column: "0001001101"
@@ -99,28 +79,7 @@ class CellularAutomaton:
         print("Reset pressed")
 
     def next_generation(self):
-        new_grid = self.grid.clone()
-        
-        # Process all cells
-        for col in range(self.cols):
-            for row in range(self.rows):
-                if self.grid[row, col] == 1:
-                    # Right neighbor (col+1, row)
-                    if col < self.cols - 1:
-                        new_grid[row, col + 1] = 1
-                    
-                    # Top-right diagonal (col+1, row-1)
-                    if col < self.cols - 1 and row > 0:
-                        new_grid[row - 1, col + 1] = 1
-                    
-                    # Bottom-right diagonal (col+1, row+1)
-                    if col < self.cols - 1 and row < self.rows - 1:
-                        new_grid[row + 1, col + 1] = 1
-                    
-                    # Clear current cell
-                    new_grid[row, col] = 0
-        
-        self.grid = new_grid
+        self.grid = push_right_binary_step(self.grid)
 
     def update(self):
         if self.running:
@@ -0,0 +1,254 @@
+class Node:
+    """Canonical quadtree node; level 0 nodes are single cells."""
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+class HashlifeEngine:
+    """Memoized quadtree (Hashlife) engine on an unbounded plane.
+
+    Cells are addressed as (row, col) like the Tk GameOfLife grid. Unlike the
+    grid engines the plane does not wrap, so patterns leaving the window keep
+    going and can come back into view.
+    """
+    NODE_BYTES = 200  # Rough cost of one cached node or result entry
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,), memory_budget=256 * 1024 * 1024):
+        self.rows = rows
+        self.cols = cols
+        self.max_entries = max(1024, memory_budget // self.NODE_BYTES)
+        self.rules = None
+
+        self.dead = Node(None, None, None, None, 0, 0)
+        self.alive = Node(None, None, None, None, 0, 1)
+        self.table = {}    # (nw, ne, sw, se) -> canonical node
+        self.results = {}  # (node, j) -> center of node advanced 2**j generations
+        self.empties = [self.dead]
+        self.collections = 0  # Times collect() has pruned the caches
+
+        self.set_rules(survival_rule, birth_rule)
+        self.clear()
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        if 0 in birth_rule:
+            raise ValueError("Hashlife cannot run birth on 0 neighbors on an unbounded plane")
+        self.rules = rules
+        self.survival_set = frozenset(survival_rule)
+        self.birth_set = frozenset(birth_rule)
+        self.results.clear()  # Memoized futures are only valid for the old rule
+
+    def clear(self):
+        self.root = self.empty(3)
+        self.origin_row = 0
+        self.origin_col = 0
+        self.generation = 0
+        self.exported = None
+        self.exported_copy = None
+
+    def join(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        node = self.table.get(key)
+        if node is None:
+            node = Node(nw, ne, sw, se, nw.level + 1,
+                        nw.population + ne.population + sw.population + se.population)
+            self.table[key] = node
+        return node
+
+    def empty(self, level):
+        while len(self.empties) <= level:
+            e = self.empties[-1]
+            self.empties.append(self.join(e, e, e, e))
+        return self.empties[level]
+
+    def expand(self):
+        # Surround the root with empty space, keeping it centered
+        root = self.root
+        e = self.empty(root.level - 1)
+        self.root = self.join(self.join(e, e, e, root.nw), self.join(e, e, root.ne, e),
+                              self.join(e, root.sw, e, e), self.join(root.se, e, e, e))
+        shift = 1 << (root.level - 1)
+        self.origin_row -= shift
+        self.origin_col -= shift
+
+    def life_4x4(self, node):
+        # Base case: next state of the center 2x2 of a 4x4 node
+        cells = [[0] * 4 for _ in range(4)]
+        for qr, qc, quad in ((0, 0, node.nw), (0, 2, node.ne), (2, 0, node.sw), (2, 2, node.se)):
+            cells[qr][qc] = quad.nw.population
+            cells[qr][qc + 1] = quad.ne.population
+            cells[qr + 1][qc] = quad.sw.population
+            cells[qr + 1][qc + 1] = quad.se.population
+        center = []
+        for r in (1, 2):
+            for c in (1, 2):
+                total = sum(cells[r + i][c + j] for i in (-1, 0, 1) for j in (-1, 0, 1)) - cells[r][c]
+                if cells[r][c]:
+                    center.append(self.alive if total in self.survival_set else self.dead)
+                else:
+                    center.append(self.alive if total in self.birth_set else self.dead)
+        return self.join(*center)
+
+    def successor(self, node, j):
+        # Center of node (level k) advanced 2**j generations, j <= k - 2
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        key = (node, j)
+        result = self.results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self.life_4x4(node)
+        else:
+            a, b, c, d = node.nw, node.ne, node.sw, node.se
+            join = self.join
+            c1 = self.successor(join(a.nw, a.ne, a.sw, a.se), j)
+            c2 = self.successor(join(a.ne, b.nw, a.se, b.sw), j)
+            c3 = self.successor(join(b.nw, b.ne, b.sw, b.se), j)
+            c4 = self.successor(join(a.sw, a.se, c.nw, c.ne), j)
+            c5 = self.successor(join(a.se, b.sw, c.ne, d.nw), j)
+            c6 = self.successor(join(b.sw, b.se, d.nw, d.ne), j)
+            c7 = self.successor(join(c.nw, c.ne, c.sw, c.se), j)
+            c8 = self.successor(join(c.ne, d.nw, c.se, d.sw), j)
+            c9 = self.successor(join(d.nw, d.ne, d.sw, d.se), j)
+            if j < node.level - 2:
+                # Already advanced far enough, just take the centers
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                # Second half of the jump
+                result = join(self.successor(join(c1, c2, c4, c5), j), self.successor(join(c2, c3, c5, c6), j),
+                              self.successor(join(c4, c5, c7, c8), j), self.successor(join(c5, c6, c8, c9), j))
+        self.results[key] = result
+        return result
+
+    def is_padded(self):
+        # True if every live cell sits in the central quarter of the root
+        root = self.root
+        return (root.level >= 3 and
+                root.nw.population == root.nw.se.se.population and
+                root.ne.population == root.ne.sw.sw.population and
+                root.sw.population == root.sw.ne.ne.population and
+                root.se.population == root.se.nw.nw.population)
+
+    def step_pow2(self, k):
+        """Advance the universe by 2**k generations in one jump."""
+        while self.root.level < k + 2 or not self.is_padded():
+            self.expand()
+        self.expand()  # Room for the pattern to grow at light speed
+        shift = 1 << (self.root.level - 2)
+        self.root = self.successor(self.root, k)
+        self.origin_row += shift
+        self.origin_col += shift
+        self.generation += 1 << k
+        if len(self.table) + len(self.results) > self.max_entries:
+            self.collect()
+
+    def step(self, generations=1):
+        k = 0
+        while generations:
+            if generations & 1:
+                self.step_pow2(k)
+            generations >>= 1
+            k += 1
+
+    def collect(self):
+        # Drop memoized results and every node the current root cannot reach
+        self.results.clear()
+        old_table = self.table
+        self.table = {}
+        stack = [self.root] + self.empties[1:]
+        while stack:
+            node = stack.pop()
+            key = (node.nw, node.ne, node.sw, node.se)
+            if node.level == 0 or key in self.table:
+                continue
+            self.table[key] = old_table.get(key, node)
+            stack.extend(key)
+        self.collections += 1
+
+    def build(self, level, cells):
+        # Quadtree for live (row, col) cells relative to a 2**level square
+        if not cells:
+            return self.empty(level)
+        if level == 0:
+            return self.alive
+        half = 1 << (level - 1)
+        quads = ([], [], [], [])
+        for r, c in cells:
+            south, east = r >= half, c >= half
+            quads[south * 2 + east].append((r - half * south, c - half * east))
+        return self.join(*(self.build(level - 1, q) for q in quads))
+
+    def set_cells(self, cells):
+        """Place live (row, col) cells anywhere on the plane, negative or outside the window included."""
+        self.clear()
+        cells = list(cells)
+        if not cells:
+            return
+        # The root starts at the top-left corner of the cells' bounding box and covers all of it
+        top = min(r for r, _ in cells)
+        left = min(c for _, c in cells)
+        extent = max(max(r for r, _ in cells) - top, max(c for _, c in cells) - left) + 1
+        level = 3
+        while (1 << level) < extent:
+            level += 1
+        self.root = self.build(level, [(r - top, c - left) for r, c in cells])
+        self.origin_row = top
+        self.origin_col = left
+
+    def live_cells(self, node=None, row=None, col=None):
+        if node is None:
+            node, row, col = self.root, self.origin_row, self.origin_col
+        if node.population == 0:
+            return
+        if node.level == 0:
+            yield row, col
+            return
+        half = 1 << (node.level - 1)
+        yield from self.live_cells(node.nw, row, col)
+        yield from self.live_cells(node.ne, row, col + half)
+        yield from self.live_cells(node.sw, row + half, col)
+        yield from self.live_cells(node.se, row + half, col + half)
+
+    def load(self, grid):
+        # Keep the unbounded universe if the app hands back an unchanged window
+        if grid is self.exported and grid == self.exported_copy:
+            return
+        self.set_cells([(i, j) for i, row in enumerate(grid) for j, value in enumerate(row) if value])
+
+    def snapshot(self):
+        # Export the rows x cols window at the origin as the Tk app's list-of-lists grid
+        grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        for r, c in self.window_cells(self.root, self.origin_row, self.origin_col):
+            grid[r][c] = 1
+        self.exported = grid
+        self.exported_copy = [row[:] for row in grid]
+        return grid
+
+    def window_cells(self, node, row, col):
+        size = 1 << node.level
+        if (node.population == 0 or row >= self.rows or col >= self.cols or
+                row + size <= 0 or col + size <= 0):
+            return
+        if node.level == 0:
+            yield row, col
+            return
+        half = size >> 1
+        yield from self.window_cells(node.nw, row, col)
+        yield from self.window_cells(node.ne, row, col + half)
+        yield from self.window_cells(node.sw, row + half, col)
+        yield from self.window_cells(node.se, row + half, col + half)
+
+    def population(self):
+        return self.root.population
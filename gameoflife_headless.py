@@ -0,0 +1,247 @@
+import argparse
+import csv
+import importlib
+import os
+import random
+import sys
+import time
+from itertools import chain
+
+# Engine name -> (module, class), imported on demand so missing optional
+# dependencies only matter for the engine that needs them. tiled and hashlife
+# run on an unbounded plane, the others wrap around the board edges.
+ENGINES = {
+    "python": ("gameoflife_headless", "PythonEngine"),
+    "sparse": ("gameoflife_sparse", "ActiveFrontierEngine"),
+    "hashlife": ("gameoflife_hashlife", "HashlifeEngine"),
+    "numpy": ("gameoflife_numpy", "NumpyEngine"),
+    "bitpacked": ("gameoflife_bitpacked", "BitPackedEngine"),
+    "blocklut": ("gameoflife_blocklut", "BlockLookupEngine"),
+    "tiled": ("gameoflife_tiled", "TiledUniverse"),
+    "threaded": ("gameoflife_threaded", "ThreadedEngine"),
+    "multiprocess": ("gameoflife_multiprocess", "MultiprocessEngine"),
+    "torch": ("gameoflife_torch", "TorchEngine"),
+}
+
+class PythonEngine:
+    """The list-of-lists next_generation of the Tk apps, without a window."""
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,)):
+        self.rows = rows
+        self.cols = cols
+        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.set_rules(survival_rule, birth_rule)
+
+    def set_rules(self, survival_rule, birth_rule):
+        self.survival_rule = list(survival_rule)
+        self.birth_rule = list(birth_rule)
+
+    def load(self, grid):
+        self.grid = [[int(value) for value in row] for row in grid]
+
+    def count_neighbors(self, row, col):
+        total = 0
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                if i == 0 and j == 0:
+                    continue
+                r = (row + i) % self.rows
+                c = (col + j) % self.cols
+                total += self.grid[r][c]
+        return total
+
+    def step(self, generations=1):
+        for _ in range(generations):
+            new_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+            for i in range(self.rows):
+                for j in range(self.cols):
+                    neighbors = self.count_neighbors(i, j)
+                    if self.grid[i][j] == 1:
+                        new_grid[i][j] = 1 if neighbors in self.survival_rule else 0
+                    else:
+                        new_grid[i][j] = 1 if neighbors in self.birth_rule else 0
+            self.grid = new_grid
+
+    def snapshot(self):
+        return self.grid
+
+    def population(self):
+        return sum(map(sum, self.grid))
+
+def create_engine(name, rows, cols, survival_rule, birth_rule):
+    module_name, class_name = ENGINES[name]
+    engine_class = getattr(importlib.import_module(module_name), class_name)
+    return engine_class(rows, cols, survival_rule, birth_rule)
+
+def parse_rule(rule):
+    """Parse a rule like "B3/S23" into (survival, birth) lists."""
+    survival, birth = [], []
+    for part in rule.upper().split("/"):
+        if part.startswith("B"):
+            birth = [int(n) for n in part[1:]]
+        elif part.startswith("S"):
+            survival = [int(n) for n in part[1:]]
+        else:
+            raise ValueError(f"Invalid rule part {part!r}, expected e.g. B3/S23")
+    for n in survival + birth:
+        if n > 8:
+            raise ValueError("Rule numbers must be between 0 and 8")
+    return survival, birth
+
+def read_pattern(path):
+    """Read a plaintext (.cells) or RLE (.rle) pattern as a list of (row, col) cells."""
+    with open(path) as f:
+        text = f.read()
+    cells = []
+    if path.lower().endswith(".rle"):
+        data = "".join(line.strip() for line in text.splitlines()
+                       if line.strip() and not line.startswith("#") and not line.lstrip().startswith("x"))
+        row = col = 0
+        count = ""
+        for char in data:
+            if char.isdigit():
+                count += char
+                continue
+            n = int(count) if count else 1
+            count = ""
+            if char == "!":
+                break
+            if char == "$":
+                row += n
+                col = 0
+            elif char == "b":
+                col += n
+            else:  # "o" and any other live state
+                cells.extend((row, col + k) for k in range(n))
+                col += n
+    else:
+        row = 0
+        for line in text.splitlines():
+            if line.startswith("!"):
+                continue
+            cells.extend((row, col) for col, char in enumerate(line) if char in "O*")
+            row += 1
+    return cells
+
+def place_cells(rows, cols, cells, at=None):
+    grid = [[0 for _ in range(cols)] for _ in range(rows)]
+    if cells:
+        height = max(r for r, _ in cells) + 1
+        width = max(c for _, c in cells) + 1
+        top, left = at if at else ((rows - height) // 2, (cols - width) // 2)
+        for r, c in cells:
+            grid[(top + r) % rows][(left + c) % cols] = 1
+    return grid
+
+def random_grid(rows, cols, density, seed):
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+def write_pgm(path, grid, rows, cols):
+    # Binary grayscale image, live cells black like the Tk apps
+    with open(path, "wb") as f:
+        f.write(f"P5\n{cols} {rows}\n255\n".encode())
+        f.write(bytes(0 if value else 255 for value in chain.from_iterable(grid)))
+
+def run(engine, generations, stats_every, snapshot_every=0, snapshot_dir=None, stats_writer=None):
+    """Step engine for generations, yielding a stats row every stats_every generations."""
+    rows, cols = engine.rows, engine.cols
+    start = last_time = time.perf_counter()
+    last_generation = 0
+    generation = 0
+    while generation < generations:
+        # Up to the next stats boundary, so rows stay on multiples of stats_every
+        chunk = min(stats_every - generation % stats_every, generations - generation)
+        if snapshot_every:
+            chunk = min(chunk, snapshot_every - generation % snapshot_every)
+        engine.step(chunk)
+        generation += chunk
+
+        now = time.perf_counter()
+        if generation % stats_every == 0 or generation == generations:
+            elapsed = now - last_time
+            done = generation - last_generation
+            row = {
+                "generation": generation,
+                "population": engine.population(),
+                "seconds": round(now - start, 6),
+                "generations_per_sec": round(done / elapsed, 3) if elapsed > 0 else 0,
+                "cell_updates_per_sec": round(done * rows * cols / elapsed) if elapsed > 0 else 0,
+            }
+            if stats_writer is not None:
+                stats_writer.writerow(row)
+            yield row
+            last_time, last_generation = time.perf_counter(), generation
+        if snapshot_every and generation % snapshot_every == 0:
+            write_pgm(os.path.join(snapshot_dir, f"gen{generation:08d}.pgm"), engine.snapshot(), rows, cols)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Game of Life without a window")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=1000)
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="numpy")
+    parser.add_argument("--rule", default="B3/S23", help="Birth/survival rule, e.g. B3/S23 or B36/S23")
+    parser.add_argument("--pattern", help="Initial pattern file (.cells or .rle), centered on the board")
+    parser.add_argument("--at", help="Place the pattern's top-left corner at ROW,COL instead")
+    parser.add_argument("--seed", type=int, help="Random seed for a random soup (default when no pattern)")
+    parser.add_argument("--density", type=float, default=0.5, help="Live cell fraction of the random soup")
+    parser.add_argument("--stats-every", type=int, default=100, help="Generations between stats rows")
+    parser.add_argument("--stats", help="Write the stats rows to this CSV file")
+    parser.add_argument("--snapshot-every", type=int, default=0, help="Generations between PGM snapshots (0 = off)")
+    parser.add_argument("--snapshot-dir", default="snapshots")
+    args = parser.parse_args(argv)
+
+    if args.stats_every < 1:
+        parser.error("--stats-every must be at least 1")
+    if args.snapshot_every < 0:
+        parser.error("--snapshot-every must be 0 (off) or more")
+    if args.generations < 0:
+        parser.error("--generations must be 0 or more")
+    try:
+        survival_rule, birth_rule = parse_rule(args.rule)
+    except ValueError as e:
+        parser.error(str(e))
+    at = None
+    if args.at:
+        try:
+            at = tuple(int(v) for v in args.at.split(","))
+        except ValueError:
+            at = ()
+        if len(at) != 2:
+            parser.error(f"--at must be ROW,COL, got {args.at!r}")
+    if args.pattern:
+        grid = place_cells(args.rows, args.cols, read_pattern(args.pattern), at)
+    else:
+        grid = random_grid(args.rows, args.cols, args.density, args.seed)
+    if args.snapshot_every:
+        os.makedirs(args.snapshot_dir, exist_ok=True)
+
+    engine = create_engine(args.engine, args.rows, args.cols, survival_rule, birth_rule)
+    engine.load(grid)
+    print(f"Engine {args.engine}, {args.rows}x{args.cols}, rule {args.rule}, population {engine.population()}")
+
+    stats_file = open(args.stats, "w", newline="") if args.stats else None
+    stats_writer = None
+    if stats_file:
+        stats_writer = csv.DictWriter(stats_file, fieldnames=["generation", "population", "seconds",
+                                                              "generations_per_sec", "cell_updates_per_sec"])
+        stats_writer.writeheader()
+    try:
+        start = time.perf_counter()
+        for row in run(engine, args.generations, args.stats_every, args.snapshot_every, args.snapshot_dir, stats_writer):
+            print(f"Generation {row['generation']}: population {row['population']}, "
+                  f"{row['generations_per_sec']:.1f} gen/s, {row['cell_updates_per_sec']:.3g} cell updates/s")
+        elapsed = time.perf_counter() - start
+    finally:
+        if stats_file:
+            stats_file.close()
+        if hasattr(engine, "close"):
+            engine.close()
+
+    rate = args.generations * args.rows * args.cols / elapsed if elapsed > 0 else 0
+    print(f"Ran {args.generations} generations in {elapsed:.3f}s ({rate:.3g} cell updates/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
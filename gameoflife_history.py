@@ -0,0 +1,137 @@
+import zlib
+from collections import deque
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # Histories of plain list-of-lists grids work without NumPy
+    np = None
+
+ENTRY_OVERHEAD = 100  # Rough bytes per entry on top of its compressed data
+
+def xor_bytes(a, b):
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+class GridHistory:
+    """Generation history stored as keyframes plus XOR deltas.
+
+    Every keyframe_interval entries a full grid is stored, the entries in
+    between only hold the XOR with the previous generation. Both are zlib
+    compressed, so a mostly unchanged board costs a few bytes per generation.
+    The oldest entries are dropped once max_bytes is exceeded.
+    """
+
+    def __init__(self, rows, cols, max_bytes=64 * 1024 * 1024, keyframe_interval=32):
+        self.rows = rows
+        self.cols = cols
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        self.entries = deque()  # (offset from keyframe, compressed data)
+        self.nbytes = 0
+        self.index = -1         # Position of the grid returned last
+        self.current = None     # Raw bytes of the grid at index
+        self.arrays = False     # Hand out NumPy arrays if that is what we were given
+
+    def __len__(self):
+        return len(self.entries)
+
+    def encode(self, grid):
+        if np is not None and isinstance(grid, np.ndarray):
+            self.arrays = True
+            return np.ascontiguousarray(grid, dtype=np.uint8).tobytes()
+        self.arrays = False
+        return bytes(chain.from_iterable(grid))
+
+    def decode(self, raw):
+        if self.arrays:
+            return np.frombuffer(raw, dtype=np.uint8).reshape(self.rows, self.cols).copy()
+        cols = self.cols
+        return [list(raw[i * cols:(i + 1) * cols]) for i in range(self.rows)]
+
+    def push(self, offset, data):
+        self.entries.append((offset, data))
+        self.nbytes += len(data) + ENTRY_OVERHEAD
+
+    def pop(self):
+        offset, data = self.entries.pop()
+        self.nbytes -= len(data) + ENTRY_OVERHEAD
+
+    def reset(self, grid):
+        self.entries.clear()
+        self.nbytes = 0
+        self.current = self.encode(grid)
+        self.push(0, zlib.compress(self.current, 1))
+        self.index = 0
+
+    def append(self, grid):
+        """Store grid after the current position, dropping any states ahead of it."""
+        if self.index < 0:
+            self.reset(grid)
+            return
+        while len(self.entries) > self.index + 1:
+            self.pop()
+        raw = self.encode(grid)
+        offset = self.entries[-1][0] + 1
+        if offset >= self.keyframe_interval:
+            self.push(0, zlib.compress(raw, 1))
+        else:
+            self.push(offset, zlib.compress(xor_bytes(self.current, raw), 1))
+        self.current = raw
+        self.index += 1
+        self.evict()
+
+    def evict(self):
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            offset, data = self.entries.popleft()
+            self.nbytes -= len(data) + ENTRY_OVERHEAD
+            self.index -= 1
+            # The oldest entry must stay a keyframe
+            next_offset, next_data = self.entries[0]
+            if next_offset:
+                raw = xor_bytes(zlib.decompress(data), zlib.decompress(next_data))
+                keyframe = zlib.compress(raw, 1)
+                self.entries[0] = (0, keyframe)
+                self.nbytes += len(keyframe) - len(next_data)
+                # Deltas that followed now count from the new keyframe
+                for i in range(1, len(self.entries)):
+                    entry_offset, entry_data = self.entries[i]
+                    if entry_offset == 0:
+                        break
+                    self.entries[i] = (entry_offset - next_offset, entry_data)
+
+    def back(self):
+        if self.index <= 0:
+            return None
+        offset, data = self.entries[self.index]
+        if offset:
+            # Undo the delta that led to the current generation
+            self.current = xor_bytes(self.current, zlib.decompress(data))
+        else:
+            self.current = self.raw_at(self.index - 1)
+        self.index -= 1
+        return self.decode(self.current)
+
+    def forward(self):
+        if self.index >= len(self.entries) - 1:
+            return None
+        self.index += 1
+        offset, data = self.entries[self.index]
+        if offset:
+            self.current = xor_bytes(self.current, zlib.decompress(data))
+        else:
+            self.current = zlib.decompress(data)
+        return self.decode(self.current)
+
+    def raw_at(self, index):
+        offset, data = self.entries[index]
+        start = index - offset
+        raw = zlib.decompress(self.entries[start][1])
+        for i in range(start + 1, index + 1):
+            raw = xor_bytes(raw, zlib.decompress(self.entries[i][1]))
+        return raw
+
+    def seek(self, index):
+        """Jump to any stored generation, replaying at most keyframe_interval deltas."""
+        self.current = self.raw_at(index)
+        self.index = index
+        return self.decode(self.current)
@@ -0,0 +1,115 @@
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from gameoflife_numpy import rule_table, step_stripe, stripe_scratch
+
+# Commands written to the shared control block before releasing the workers
+RUN = 0
+STOP = 1
+
+def stripe_worker(names, rows, cols, start, stop, control, rule_table, start_barrier, step_barrier, done_barrier):
+    """Step rows start..stop of the shared grid until told to stop."""
+    shms = [shared_memory.SharedMemory(name=name) for name in names]
+    buffers = [np.ndarray((rows, cols), dtype=np.uint8, buffer=shm.buf) for shm in shms]
+    scratch = stripe_scratch(stop - start, cols)
+
+    while True:
+        start_barrier.wait()
+        command, generations, front = control[0], control[1], control[2]
+        if command == STOP:
+            break
+        table = np.array(rule_table[:], dtype=np.uint8)
+        for _ in range(generations):
+            src, dst = buffers[front], buffers[1 - front]
+            step_stripe(src, dst, start, stop, table, scratch)
+            # Nobody may read the next generation before every stripe wrote it
+            step_barrier.wait()
+            front = 1 - front
+        done_barrier.wait()
+
+    buffers = src = dst = None  # Release the views before unmapping
+    for shm in shms:
+        shm.close()
+
+class MultiprocessEngine:
+    """Toroidal Game of Life engine split into horizontal stripes, one process each.
+
+    The grid is double buffered in shared memory. Every generation each worker
+    reads its stripe plus one halo row from each neighbor out of the front
+    buffer, writes its stripe of the back buffer and waits on a barrier.
+    """
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,), workers=None):
+        self.rows = rows
+        self.cols = cols
+        workers = max(1, min(workers or os.cpu_count() or 1, rows))
+        self.rules = None
+
+        self.shms = [shared_memory.SharedMemory(create=True, size=rows * cols) for _ in range(2)]
+        self.buffers = [np.ndarray((rows, cols), dtype=np.uint8, buffer=shm.buf) for shm in self.shms]
+        for buffer in self.buffers:
+            buffer.fill(0)
+        self.front = 0
+
+        # Control block: command, generations, front buffer index
+        self.control = mp.Array("i", 3, lock=False)
+        self.rule_table = mp.Array("B", 18, lock=False)
+        self.set_rules(survival_rule, birth_rule)
+
+        self.start_barrier = mp.Barrier(workers + 1)
+        self.done_barrier = mp.Barrier(workers + 1)
+        # Kept on self so spawned workers can still unpickle it after __init__
+        self.step_barrier = mp.Barrier(workers)
+        bounds = np.linspace(0, rows, workers + 1).astype(int)
+        names = [shm.name for shm in self.shms]
+        self.processes = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            process = mp.Process(target=stripe_worker, daemon=True,
+                                 args=(names, rows, cols, int(start), int(stop), self.control, self.rule_table,
+                                       self.start_barrier, self.step_barrier, self.done_barrier))
+            process.start()
+            self.processes.append(process)
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        self.rules = rules
+        self.rule_table[:] = rule_table(survival_rule, birth_rule).tolist()
+
+    def load(self, grid):
+        if grid is not self.buffers[self.front]:
+            np.copyto(self.buffers[self.front], np.asarray(grid, dtype=np.uint8))
+
+    def step(self, generations=1):
+        self.control[0] = RUN
+        self.control[1] = generations
+        self.control[2] = self.front
+        self.start_barrier.wait()
+        self.done_barrier.wait()
+        self.front = (self.front + generations) % 2
+
+    def snapshot(self):
+        return self.buffers[self.front]
+
+    def population(self):
+        return int(np.count_nonzero(self.buffers[self.front]))
+
+    def close(self):
+        if not self.processes:
+            return
+        self.control[0] = STOP
+        self.start_barrier.wait()
+        for process in self.processes:
+            process.join()
+        self.processes = []
+        self.buffers = []
+        for shm in self.shms:
+            shm.unlink()
+            try:
+                shm.close()
+            except BufferError:
+                pass  # A snapshot is still referenced, the mapping goes away with it
@@ -0,0 +1,77 @@
+import numpy as np
+
+def stripe_scratch(height, cols):
+    """Preallocate the buffers step_stripe needs for a stripe of height rows."""
+    return (np.zeros((height + 2, cols + 2), dtype=np.uint8),
+            np.zeros((height + 2, cols), dtype=np.uint8),
+            np.zeros((height, cols), dtype=np.uint8),
+            np.zeros((height, cols), dtype=np.uint8))
+
+def step_stripe(src, dst, start, stop, rule_table, scratch):
+    """Write rows start..stop of the next generation of the torus src into dst."""
+    padded, row_sums, neighbors, index = scratch
+    rows = src.shape[0]
+    # Stripe plus one halo row above and below, wrapping around the torus
+    padded[1:-1, 1:-1] = src[start:stop]
+    padded[0, 1:-1] = src[start - 1]
+    padded[-1, 1:-1] = src[stop % rows]
+    padded[:, 0] = padded[:, -2]
+    padded[:, -1] = padded[:, 1]
+
+    np.add(padded[:, :-2], padded[:, 1:-1], out=row_sums)
+    row_sums += padded[:, 2:]
+    np.add(row_sums[:-2], row_sums[1:-1], out=neighbors)
+    neighbors += row_sums[2:]
+    center = padded[1:-1, 1:-1]
+    neighbors -= center
+    np.multiply(center, 9, out=index)
+    index += neighbors
+    np.take(rule_table, index, out=dst[start:stop])
+
+def rule_table(survival_rule, birth_rule):
+    """Next state lookup indexed by state * 9 + neighbors.
+
+    The first 9 entries are for dead cells (birth), the last 9 for live cells
+    (survival).
+    """
+    table = np.zeros(18, dtype=np.uint8)
+    table[list(birth_rule)] = 1
+    table[[9 + n for n in survival_rule]] = 1
+    return table
+
+class NumpyEngine:
+    """Toroidal Game of Life engine backed by a contiguous uint8 array."""
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,)):
+        self.rows = rows
+        self.cols = cols
+        self.grid = np.zeros((rows, cols), dtype=np.uint8)
+        self.rules = None
+
+        # Preallocated scratch buffers so stepping does not allocate
+        self.next_grid = np.zeros((rows, cols), dtype=np.uint8)
+        self.scratch = stripe_scratch(rows, cols)
+        self.set_rules(survival_rule, birth_rule)
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        self.rules = rules
+        self.rule_table = rule_table(survival_rule, birth_rule)
+
+    def load(self, grid):
+        if grid is not self.grid:
+            np.copyto(self.grid, np.asarray(grid, dtype=np.uint8))
+
+    def step(self, generations=1):
+        for _ in range(generations):
+            # The whole torus is one stripe
+            step_stripe(self.grid, self.next_grid, 0, self.rows, self.rule_table, self.scratch)
+            self.grid, self.next_grid = self.next_grid, self.grid
+
+    def snapshot(self):
+        return self.grid
+
+    def population(self):
+        return int(np.count_nonzero(self.grid))
@@ -0,0 +1,87 @@
+class ActiveFrontierEngine:
+    """Toroidal Game of Life engine that only re-evaluates active cells.
+
+    Neighbor counts are kept up to date incrementally, so a generation only
+    touches the cells that changed last generation and their neighbors. When
+    more than dense_threshold of the board is active every cell is evaluated
+    in a plain scan instead, which is cheaper than building the active set.
+    """
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,), dense_threshold=0.25):
+        self.rows = rows
+        self.cols = cols
+        self.dense_threshold = dense_threshold
+        self.rules = None
+        self.grid = None
+        self.set_rules(survival_rule, birth_rule)
+        self.load([[0 for _ in range(cols)] for _ in range(rows)])
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        self.rules = rules
+        # next_state[state][neighbors]
+        self.next_state = ([1 if n in birth_rule else 0 for n in range(9)],
+                           [1 if n in survival_rule else 0 for n in range(9)])
+        self.active = None  # Every cell may react to the new rule
+
+    def load(self, grid):
+        # Keep the incremental state if the app hands back our own, unedited grid
+        if grid is self.grid and grid == self.shadow:
+            return
+        self.grid = [[int(value) for value in row] for row in grid]
+        self.shadow = [row[:] for row in self.grid]
+        self.counts = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.grid[r][c]:
+                    self.add_to_neighbors(r, c, 1)
+        self.active = None
+
+    def add_to_neighbors(self, row, col, delta):
+        rows, cols, counts = self.rows, self.cols, self.counts
+        for i in (-1, 0, 1):
+            count_row = counts[(row + i) % rows]
+            for j in (-1, 0, 1):
+                if i or j:
+                    count_row[(col + j) % cols] += delta
+
+    def find_changes(self):
+        grid, counts, next_state = self.grid, self.counts, self.next_state
+        changes = []
+        if self.active is None or len(self.active) > self.dense_threshold * self.rows * self.cols:
+            # Dense fallback: scan every cell
+            for r in range(self.rows):
+                grid_row, count_row = grid[r], counts[r]
+                for c in range(self.cols):
+                    state = grid_row[c]
+                    if next_state[state][count_row[c]] != state:
+                        changes.append((r, c))
+        else:
+            for r, c in self.active:
+                state = grid[r][c]
+                if next_state[state][counts[r][c]] != state:
+                    changes.append((r, c))
+        return changes
+
+    def step(self, generations=1):
+        rows, cols = self.rows, self.cols
+        for _ in range(generations):
+            changes = self.find_changes()
+            active = set()
+            for r, c in changes:
+                state = 1 - self.grid[r][c]
+                self.grid[r][c] = state
+                self.shadow[r][c] = state
+                self.add_to_neighbors(r, c, 1 if state else -1)
+                for i in (-1, 0, 1):
+                    for j in (-1, 0, 1):
+                        active.add(((r + i) % rows, (c + j) % cols))
+            self.active = active
+
+    def snapshot(self):
+        return self.grid
+
+    def population(self):
+        return sum(map(sum, self.grid))
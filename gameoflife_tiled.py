@@ -0,0 +1,134 @@
+import numpy as np
+
+from gameoflife_numpy import rule_table
+
+TILE_SIZE = 64
+
+class TiledUniverse:
+    """Unbounded Game of Life plane made of TILE_SIZE x TILE_SIZE tiles.
+
+    Tiles live in a dict keyed by (tile_row, tile_col) and are allocated when
+    a cell is born in them and freed once they are empty again. Only tiles
+    that changed last generation, and their neighbors, are stepped.
+    """
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,)):
+        self.rows = rows
+        self.cols = cols
+        self.tiles = {}
+        self.dirty = set()
+        self.rules = None
+        self.exported = None
+        self.exported_copy = None
+        self.generation = 0
+        self.padded = np.zeros((TILE_SIZE + 2, TILE_SIZE + 2), dtype=np.uint8)
+        self.set_rules(survival_rule, birth_rule)
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        if 0 in birth_rule:
+            raise ValueError("A tiled universe cannot run birth on 0 neighbors on an unbounded plane")
+        self.rules = rules
+        self.rule_table = rule_table(survival_rule, birth_rule)
+        self.dirty = set(self.tiles)  # Every tile may react to the new rule
+
+    def set_cell(self, row, col, value):
+        key = (row // TILE_SIZE, col // TILE_SIZE)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if not value:
+                return
+            tile = self.tiles[key] = np.zeros((TILE_SIZE, TILE_SIZE), dtype=np.uint8)
+        tile[row % TILE_SIZE, col % TILE_SIZE] = 1 if value else 0
+        self.dirty.add(key)
+        if not value and not tile.any():
+            del self.tiles[key]
+
+    def get_cell(self, row, col):
+        tile = self.tiles.get((row // TILE_SIZE, col // TILE_SIZE))
+        return 0 if tile is None else int(tile[row % TILE_SIZE, col % TILE_SIZE])
+
+    def gather(self, tr, tc):
+        # Tile plus a one-cell border taken from the eight surrounding tiles
+        p = self.padded
+        p.fill(0)
+        get = self.tiles.get
+        for dr, dc, dst, src in (
+                (0, 0, (slice(1, -1), slice(1, -1)), (slice(None), slice(None))),
+                (-1, 0, (0, slice(1, -1)), (-1, slice(None))),
+                (1, 0, (-1, slice(1, -1)), (0, slice(None))),
+                (0, -1, (slice(1, -1), 0), (slice(None), -1)),
+                (0, 1, (slice(1, -1), -1), (slice(None), 0)),
+                (-1, -1, (0, 0), (-1, -1)),
+                (-1, 1, (0, -1), (-1, 0)),
+                (1, -1, (-1, 0), (0, -1)),
+                (1, 1, (-1, -1), (0, 0))):
+            tile = get((tr + dr, tc + dc))
+            if tile is not None:
+                p[dst] = tile[src]
+        return p
+
+    def step_tile(self, tr, tc):
+        p = self.gather(tr, tc)
+        if not p.any():
+            return None
+        # Separable 3x3 box sum, then the state * 9 + neighbors lookup
+        row_sums = p[:, :-2] + p[:, 1:-1] + p[:, 2:]
+        neighbors = row_sums[:-2] + row_sums[1:-1] + row_sums[2:]
+        center = p[1:-1, 1:-1]
+        neighbors -= center
+        return self.rule_table[center * 9 + neighbors]
+
+    def step(self, generations=1):
+        for _ in range(generations):
+            candidates = set()
+            for tr, tc in self.dirty:
+                for dr in (-1, 0, 1):
+                    for dc in (-1, 0, 1):
+                        candidates.add((tr + dr, tc + dc))
+
+            # Read from the old tiles only, then swap in the results
+            updates = {key: self.step_tile(*key) for key in candidates}
+            self.dirty = set()
+            for key, tile in updates.items():
+                old = self.tiles.get(key)
+                if tile is None or not tile.any():
+                    if old is not None:
+                        del self.tiles[key]
+                        self.dirty.add(key)
+                elif old is None or not np.array_equal(old, tile):
+                    self.tiles[key] = tile
+                    self.dirty.add(key)
+            self.generation += 1
+
+    def live_cells(self):
+        for (tr, tc), tile in self.tiles.items():
+            for r, c in np.argwhere(tile):
+                yield tr * TILE_SIZE + int(r), tc * TILE_SIZE + int(c)
+
+    def population(self):
+        return sum(int(np.count_nonzero(tile)) for tile in self.tiles.values())
+
+    def load(self, grid):
+        # Keep the unbounded universe if the app hands back an unchanged window
+        if grid is self.exported and np.array_equal(grid, self.exported_copy):
+            return
+        self.tiles = {}
+        self.dirty = set()
+        self.generation = 0
+        for r, c in np.argwhere(np.asarray(grid, dtype=np.uint8)):
+            self.set_cell(int(r), int(c), 1)
+
+    def snapshot(self):
+        # Export the rows x cols window at the origin as a grid[i][j] array
+        grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for (tr, tc), tile in self.tiles.items():
+            r0, c0 = tr * TILE_SIZE, tc * TILE_SIZE
+            r1, c1 = min(r0 + TILE_SIZE, self.rows), min(c0 + TILE_SIZE, self.cols)
+            if r1 > max(r0, 0) and c1 > max(c0, 0):
+                grid[max(r0, 0):r1, max(c0, 0):c1] = tile[max(-r0, 0):r1 - r0, max(-c0, 0):c1 - c0]
+        self.exported = grid
+        self.exported_copy = grid.copy()
+        return grid
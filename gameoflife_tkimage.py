@@ -0,0 +1,34 @@
+import tkinter as tk
+import numpy as np
+
+class GrayscaleRenderer:
+    """Persistent Tk image showing a grid of 0.0-1.0 cell values.
+
+    The grid is written once per frame into a preallocated PGM buffer at one
+    pixel per cell, and Tk zooms it onto the display image by cell_size.
+    """
+
+    def __init__(self, canvas, rows, cols, cell_size):
+        header = f'P5\n{cols} {rows}\n255\n'.encode()
+        self.buffer = np.zeros(len(header) + rows * cols, dtype=np.uint8)
+        self.buffer[:len(header)] = np.frombuffer(header, dtype=np.uint8)
+        self.pixels = self.buffer[len(header):].reshape(rows, cols)
+        self.cell_size = cell_size
+
+        self.frame = tk.PhotoImage(master=canvas, width=cols, height=rows)
+        if cell_size == 1:
+            self.photo = self.frame
+        else:
+            self.photo = tk.PhotoImage(master=canvas, width=cols * cell_size, height=rows * cell_size)
+        self.image = canvas.create_image(0, 0, image=self.photo, anchor='nw')
+
+    def draw(self, grid_np):
+        # Scale cell values to 0-255 straight into the pixel part of the PGM buffer
+        if grid_np.dtype.kind == 'f':
+            np.multiply(grid_np, 255, out=self.pixels, casting='unsafe')
+        else:
+            np.multiply(grid_np, 255, out=self.pixels, dtype=np.uint8, casting='unsafe')
+        self.frame.configure(data=self.buffer.tobytes(), format='PPM')
+        if self.photo is not self.frame:
+            # Integer zoom happens inside Tk, into the image the canvas already shows
+            self.photo.tk.call(self.photo, 'copy', self.frame, '-zoom', self.cell_size, self.cell_size)
@@ -0,0 +1,139 @@
+import numpy as np
+import torch
+
+from gameoflife_numpy import rule_table
+
+def fused_step(padded, rule_bits):
+    """Next state of the padded grid's interior as one elementwise expression for torch.compile.
+
+    Bit state * 9 + neighbors of rule_bits is the next state, like the rule
+    table of NumpyEngine. 3x3 total + 8 * state is that same index.
+    """
+    rows = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+    total = rows[:-2] + rows[1:-1] + rows[2:]
+    state = padded[1:-1, 1:-1]
+    return ((rule_bits >> (total.int() + 8 * state.int())) & 1).to(torch.uint8)
+
+class TorchEngine:
+    """Game of Life engine on uint8 torch tensors, allocating nothing per step.
+
+    The grid is double buffered and the neighbor count is a separable 3x3 box
+    sum into preallocated buffers. Any B/S rule is looked up in an 18-entry
+    table. With compile=True the count and rule run as one torch.compile'd
+    kernel. With wrap=False cells beyond the border count as dead, like the
+    conv2d padding of gameoflife_gpu3.py.
+    """
+
+    def __init__(self, rows, cols, survival_rule=(2, 3), birth_rule=(3,), device=None, wrap=True, compile=False):
+        self.rows = rows
+        self.cols = cols
+        self.wrap = wrap
+        self.device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+        uint8 = dict(dtype=torch.uint8, device=self.device)
+        self.grid = torch.zeros((rows, cols), **uint8)
+        self.next_grid = torch.zeros((rows, cols), **uint8)
+        self.padded = torch.zeros((rows + 2, cols + 2), **uint8)
+        self.row_sums = torch.zeros((rows + 2, cols), **uint8)
+        self.counts = torch.zeros((rows, cols), **uint8)
+        self.index = torch.zeros((rows, cols), dtype=torch.int32, device=self.device)
+        self.fused = torch.compile(fused_step) if compile else None
+        self.rules = None
+        self.set_rules(survival_rule, birth_rule)
+
+    def set_rules(self, survival_rule, birth_rule):
+        rules = (tuple(survival_rule), tuple(birth_rule))
+        if rules == self.rules:
+            return
+        self.rules = rules
+        table = rule_table(survival_rule, birth_rule)
+        self.table = torch.as_tensor(table, device=self.device)
+        # Same table as bits, a tensor so new rules don't recompile the fused kernel
+        self.rule_bits = torch.tensor(sum(int(bit) << i for i, bit in enumerate(table)), dtype=torch.int32,
+                                      device=self.device)
+
+    def load(self, grid):
+        if not isinstance(grid, torch.Tensor):
+            grid = torch.as_tensor(np.asarray(grid, dtype=np.uint8))
+        self.grid.copy_(grid.reshape(self.rows, self.cols))
+
+    def step(self, generations=1):
+        """Advance generations on the device without waiting for it or copying to the host."""
+        p, row_sums, counts, index = self.padded, self.row_sums, self.counts, self.index
+        for _ in range(generations):
+            p[1:-1, 1:-1].copy_(self.grid)
+            if self.wrap:
+                p[0, 1:-1].copy_(self.grid[-1])
+                p[-1, 1:-1].copy_(self.grid[0])
+                p[:, 0].copy_(p[:, -2])
+                p[:, -1].copy_(p[:, 1])
+
+            done = False
+            if self.fused is not None:
+                try:
+                    self.next_grid.copy_(self.fused(p, self.rule_bits))
+                    done = True
+                except Exception as e:  # No usable compiler backend on this machine
+                    print(f"torch.compile failed, using the eager kernels: {e}")
+                    self.fused = None
+            if not done:
+                torch.add(p[:, :-2], p[:, 1:-1], out=row_sums)
+                row_sums.add_(p[:, 2:])
+                torch.add(row_sums[:-2], row_sums[1:-1], out=counts)
+                counts.add_(row_sums[2:])
+                # 3x3 total + 8 * state == state * 9 + neighbors
+                counts.add_(self.grid, alpha=8)
+                index.copy_(counts)
+                torch.index_select(self.table, 0, index.view(-1), out=self.next_grid.view(-1))
+
+            self.grid, self.next_grid = self.next_grid, self.grid
+
+    def snapshot(self):
+        return self.grid.cpu().numpy()
+
+    def population(self):
+        return int(self.grid.sum().item())
+
+class FrameTransfer:
+    """Device to host frame copies that overlap with computing the next frame.
+
+    On CUDA, frames are copied with non_blocking=True into two pinned host
+    buffers. submit() starts copying frame N and returns frame N-1, whose copy
+    has had a whole frame to finish. Copies run on the compute stream, so
+    the kernels that overwrite a grid are queued behind its copy. CPU tensors
+    already live in host memory, so they are returned as they are.
+    """
+
+    def __init__(self, device):
+        self.device = torch.device(device)
+        self.pinned = self.device.type == "cuda"
+        self.buffers = [None, None]
+        self.events = [None, None]
+        self.next = 0          # Buffer the next copy goes into
+        self.pending = None    # Buffer holding the last submitted frame
+
+    def submit(self, tensor):
+        """Start copying tensor to the host and return the previously submitted frame."""
+        if not self.pinned:
+            return tensor.numpy()
+        i = self.next
+        buffer = self.buffers[i]
+        if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+            buffer = self.buffers[i] = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            self.events[i] = torch.cuda.Event()
+        buffer.copy_(tensor, non_blocking=True)
+        self.events[i].record()
+        self.next = 1 - i
+        previous, self.pending = self.pending, i
+        # The very first frame has nothing before it to show
+        return self.wait(i if previous is None else previous)
+
+    def fetch(self, tensor):
+        """Copy tensor to the host and wait for it, for frames that must show right away."""
+        if not self.pinned:
+            return tensor.numpy()
+        self.submit(tensor)
+        return self.wait(self.pending)
+
+    def wait(self, i):
+        self.events[i].synchronize()
+        return self.buffers[i].numpy()
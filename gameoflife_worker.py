@@ -0,0 +1,69 @@
+import threading
+
+def copy_grid(grid):
+    """Copy a list-of-lists grid or a NumPy array grid."""
+    if isinstance(grid, list):
+        return [list(row) for row in grid]
+    return grid.copy()
+
+class SimulationWorker:
+    """Advance a simulation on a background thread as fast as it can go.
+
+    The display calls latest() at its own rate. Only then does the worker copy
+    the current state into the front buffer, so the simulation never waits for
+    drawing and generations in between are simply not shown.
+    """
+
+    def __init__(self, step, snapshot):
+        self.step = step          # Advances the simulation by one generation
+        self.snapshot = snapshot  # Returns a private copy of the current state
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.front = None
+        self.front_generation = 0
+        self.frame_requested = True
+        self.running = threading.Event()
+        self.idle = threading.Event()
+        self.idle.set()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            self.running.wait()
+            if self.stopping:
+                break
+            while self.running.is_set() and not self.stopping:
+                self.step()
+                self.generation += 1
+                if self.frame_requested:
+                    frame = self.snapshot()
+                    with self.lock:
+                        self.front = frame
+                        self.front_generation = self.generation
+                        self.frame_requested = False
+            self.idle.set()
+
+    def resume(self):
+        self.idle.clear()
+        self.running.set()
+
+    def pause(self):
+        """Stop stepping and wait until the current generation is finished."""
+        self.running.clear()
+        self.idle.wait()
+
+    def latest(self):
+        """Return the newest unseen frame and its generation, or (None, generation)."""
+        with self.lock:
+            frame, generation = self.front, self.front_generation
+            self.front = None
+            self.frame_requested = True
+        return frame, generation
+
+    def close(self):
+        self.pause()
+        self.stopping = True
+        self.running.set()
+        self.thread.join()
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from gameoflife_3d_numpy import Numpy3DEngine
+from gameoflife_3d_sparse import Sparse3DEngine
+from gameoflife_benchmark import GLIDER_PATTERN
+
+@pytest.mark.parametrize("rules", [(4, 5, 4, 4), (2, 3, 3, 3), (4, 6, 5, 7), (0, 3, 2, 2)])
+def test_matches_numpy_engine(rules):
+    rng = np.random.default_rng(0)
+    grid = (rng.random((12, 14, 10)) < 0.2).astype(np.uint8)
+    dense = Numpy3DEngine(grid.shape, *rules)
+    sparse = Sparse3DEngine(grid.shape, *rules)
+    dense.load(grid)
+    sparse.load(grid)
+    for _ in range(6):
+        dense.step()
+        sparse.step()
+        assert np.array_equal(dense.snapshot(), sparse.snapshot())
+
+def run_unbounded(cells, rules, generations):
+    engine = Sparse3DEngine(None, *rules)
+    engine.set_cells(cells)
+    engine.step(generations)
+    return {tuple(cell) for cell in engine.snapshot()}
+
+@pytest.mark.parametrize("rules", [(2, 3, 3, 3), (0, 3, 2, 2)])
+def test_far_apart_gliders(rules):
+    # Too far apart for one int64 numbering of their bounding box
+    glider = np.array(GLIDER_PATTERN, dtype=np.int64)
+    distance = 3_000_000
+    near = run_unbounded(glider, rules, 3)
+    far = run_unbounded(np.concatenate([glider, glider + distance]), rules, 3)
+    expected = near | {(x + distance, y + distance, z + distance) for x, y, z in near}
+    assert far == expected
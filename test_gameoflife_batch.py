@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+
+from gameoflife_batch import BatchedTorchEngine, main
+
+def test_run_samples_the_last_generation():
+    engine = BatchedTorchEngine(2, 16, 16, [((2, 3), (3,)), ((2, 3), (3, 6))], device="cpu")
+    engine.randomize([1, 2])
+    curves = engine.run(100, record_every=7)
+    assert curves.shape == (16, 2)  # Generations 0, 7, ..., 98 and 100
+    assert np.array_equal(curves[-1], engine.populations().numpy())
+
+@pytest.mark.parametrize("args", [["--record-every", "0"], ["--seeds", "0"], ["--generations", "-1"]])
+def test_rejects_bad_options(args):
+    with pytest.raises(SystemExit) as error:
+        main(args)
+    assert error.value.code == 2
@@ -0,0 +1,108 @@
+import pytest
+import torch
+
+from gameoflife_column import (ColumnSweepEngine, left_average_step, left_diagonal_average_step,
+                               push_right_binary_step, push_right_step)
+
+# The original per-cell next_generation loops of gameoflife_gpu6.py to gameoflife_gpu9.py
+
+def left_average_loop(grid):
+    rows, cols = grid.shape
+    new_grid = grid.clone()
+    for col in range(1, cols):
+        for row in range(rows):
+            neighbors = torch.zeros(3, device=grid.device)
+            neighbors[0] = grid[row, col - 1]
+            neighbors[1] = grid[row - 1, col] if row > 0 else 0.0
+            neighbors[2] = grid[row + 1, col] if row < rows - 1 else 0.0
+            avg = torch.sum(neighbors) / 3
+            new_val = grid[row, col] + avg
+            new_grid[row, col] = 0.0 if new_val > 1.0 else torch.round(new_val * 10) / 10
+    return new_grid
+
+def left_diagonal_average_loop(grid):
+    rows, cols = grid.shape
+    new_grid = grid.clone()
+    for col in range(1, cols):
+        for row in range(rows):
+            neighbors = torch.zeros(3, device=grid.device)
+            neighbors[0] = grid[row, col - 1]
+            neighbors[1] = grid[row - 1, col - 1] if row > 0 else 0.0
+            neighbors[2] = grid[row + 1, col - 1] if row < rows - 1 else 0.0
+            avg = torch.sum(neighbors) / 3
+            current_val = grid[row, col]
+            if current_val == 1.0:
+                current_val = 0.0
+            new_grid[row, col] = min(1.0, current_val + avg)
+    new_grid = torch.maximum(new_grid - 0.1, torch.tensor(0.0, device=grid.device))
+    return torch.round(new_grid * 10) / 10
+
+def push_right_loop(grid):
+    rows, cols = grid.shape
+    new_grid = grid.clone()
+    changes = torch.zeros_like(grid)
+    for col in range(cols):
+        for row in range(rows):
+            current_val = grid[row, col]
+            if current_val >= 0.5:
+                if col < cols - 1:
+                    changes[row, col + 1] += 0.1
+                if col < cols - 1 and row > 0:
+                    changes[row - 1, col + 1] += 0.1
+                if col < cols - 1 and row < rows - 1:
+                    changes[row + 1, col + 1] += 0.1
+                new_grid[row, col] = max(0.0, current_val - 0.1)
+    new_grid = new_grid + changes
+    new_grid = torch.maximum(new_grid - 0.1, torch.tensor(0.0, device=grid.device))
+    return torch.round(new_grid * 10) / 10
+
+def push_right_binary_loop(grid):
+    rows, cols = grid.shape
+    new_grid = grid.clone()
+    for col in range(cols):
+        for row in range(rows):
+            if grid[row, col] == 1:
+                if col < cols - 1:
+                    new_grid[row, col + 1] = 1
+                if col < cols - 1 and row > 0:
+                    new_grid[row - 1, col + 1] = 1
+                if col < cols - 1 and row < rows - 1:
+                    new_grid[row + 1, col + 1] = 1
+                new_grid[row, col] = 0
+    return new_grid
+
+RULES = {
+    "gpu6": (left_average_step, left_average_loop, torch.float32),
+    "gpu7": (left_diagonal_average_step, left_diagonal_average_loop, torch.float32),
+    "gpu8": (push_right_step, push_right_loop, torch.float32),
+    "gpu9": (push_right_binary_step, push_right_binary_loop, torch.int8),
+}
+
+ROWS, COLS, GENERATIONS = 16, 40, 15
+
+def random_grid(generator, dtype):
+    if dtype == torch.float32:
+        return torch.round(torch.rand((ROWS, COLS), generator=generator) * 10) / 10
+    return (torch.rand((ROWS, COLS), generator=generator) < 0.2).to(dtype)
+
+@pytest.mark.parametrize("name", sorted(RULES))
+@pytest.mark.parametrize("seed", range(4))
+def test_step_matches_loop(name, seed):
+    step, loop, dtype = RULES[name]
+    fast = slow = random_grid(torch.Generator().manual_seed(seed), dtype)
+    for generation in range(GENERATIONS):
+        fast, slow = step(fast), loop(slow)
+        assert fast.dtype == slow.dtype == dtype
+        assert torch.equal(fast, slow), f"differs after {generation + 1} generations"
+
+def test_column_sweep_engine_matches_loop():
+    strips = 4
+    generator = torch.Generator().manual_seed(0)
+    grids = torch.stack([random_grid(generator, torch.float32) for _ in range(strips)])
+    engine = ColumnSweepEngine(strips, ROWS, COLS, device="cpu")
+    engine.load(grids)
+    slow = list(grids)
+    for generation in range(GENERATIONS):
+        engine.step()
+        slow = [left_diagonal_average_loop(grid) for grid in slow]
+        assert torch.equal(engine.snapshot(), torch.stack(slow)), f"differs after {generation + 1} generations"
@@ -0,0 +1,17 @@
+from gameoflife_hashlife import HashlifeEngine
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+def test_set_cells_outside_window():
+    engine = HashlifeEngine(16, 16)
+    engine.set_cells([(0, 0), (40, -3)])
+    assert sorted(engine.live_cells()) == [(0, 0), (40, -3)]
+
+def test_far_glider_moves_like_a_near_one():
+    near = HashlifeEngine(16, 16)
+    near.set_cells(GLIDER)
+    near.step(8)
+    far = HashlifeEngine(16, 16)
+    far.set_cells([(r - 1000, c + 5000) for r, c in GLIDER])
+    far.step(8)
+    assert sorted(far.live_cells()) == sorted((r - 1000, c + 5000) for r, c in near.live_cells())
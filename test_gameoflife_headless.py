@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from gameoflife_headless import ENGINES, PythonEngine, create_engine, random_grid, run
+
+# The unbounded engines agree with the wrapping ones only while nothing reaches the edges
+UNBOUNDED = {"hashlife", "tiled"}
+
+@pytest.mark.parametrize("generations, stats_every, snapshot_every",
+                         [(300, 100, 150), (300, 100, 0), (250, 100, 60), (7, 3, 2), (0, 10, 5)])
+def test_stats_rows_on_boundaries(tmp_path, generations, stats_every, snapshot_every):
+    engine = PythonEngine(8, 8, (2, 3), (3,))
+    rows = [row["generation"] for row in run(engine, generations, stats_every, snapshot_every, str(tmp_path))]
+    expected = list(range(stats_every, generations + 1, stats_every))
+    if generations % stats_every:
+        expected.append(generations)
+    assert rows == expected
+    if snapshot_every:
+        snapshots = sorted(path.name for path in tmp_path.iterdir())
+        assert snapshots == [f"gen{g:08d}.pgm" for g in range(snapshot_every, generations + 1, snapshot_every)]
+
+def run_engine(name, grid, rule, generations):
+    rows, cols = len(grid), len(grid[0])
+    engine = create_engine(name, rows, cols, *rule)
+    try:
+        engine.load(grid)
+        engine.step(generations)
+        return np.array(engine.snapshot(), dtype=np.uint8)
+    finally:
+        if hasattr(engine, "close"):
+            engine.close()
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+@pytest.mark.parametrize("rule", [((2, 3), (3,)), ((2, 3), (3, 6)), ((3, 4), (3, 4))])
+def test_engines_agree_on_a_contained_soup(name, rule):
+    # A 10x10 soup in the middle of 32x32 grows at most 8 cells each way in 8 generations
+    soup = random_grid(10, 10, 0.4, seed=1)
+    grid = [[0] * 32 for _ in range(32)]
+    for r in range(10):
+        grid[11 + r][11:21] = soup[r]
+    expected = run_engine("python", grid, rule, 8)
+    if name != "python":
+        pytest.importorskip(ENGINES[name][0])
+    assert np.array_equal(run_engine(name, grid, rule, 8), expected)
+
+@pytest.mark.parametrize("name", sorted(set(ENGINES) - UNBOUNDED))
+def test_wrapping_engines_agree_on_a_full_soup(name):
+    pytest.importorskip(ENGINES[name][0])
+    grid = random_grid(24, 40, 0.5, seed=2)
+    rule = ((2, 3), (3,))
+    assert np.array_equal(run_engine(name, grid, rule, 20), run_engine("python", grid, rule, 20))